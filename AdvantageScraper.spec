@@ -1,15 +1,35 @@
 # -*- mode: python ; coding: utf-8 -*-
-from PyInstaller.utils.hooks import collect_all
+# Generated by build.py - edit the profile in build.py instead of this file.
+import os
+import sys
+import shutil
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+
+# Strip debug symbols when a strip tool exists, except on Windows where a
+# stray MinGW strip can corrupt signed DLLs and the bootloader
+strip_binaries = sys.platform != 'win32' and shutil.which('strip') is not None
+
+# CI artifacts are re-compressed by the installer, so store the PYZ
+# uncompressed there to save build time (zlib level 0). This is a private
+# PyInstaller attribute, so skip it loudly if a newer version renamed it.
+# build.py gives CI builds their own work path so the cached PYZ never mixes.
+if os.environ.get('CI'):
+    try:
+        from PyInstaller.archive.writers import ZlibArchiveWriter
+    except ImportError:
+        ZlibArchiveWriter = None
+    if hasattr(ZlibArchiveWriter, '_COMPRESSION_LEVEL'):
+        ZlibArchiveWriter._COMPRESSION_LEVEL = 0
+    else:
+        print('WARNING: ZlibArchiveWriter._COMPRESSION_LEVEL not found; PYZ stays compressed')
 
 datas = [('icon.png', '.'), ('icon.ico', '.')]
 binaries = []
-hiddenimports = ['flask', 'flask_cors', 'openpyxl', 'tkinter', 'tkinter.font', 'socket', 'webbrowser', 'threading', 'queue', 'et_xmlfile', 'jdcal']
-tmp_ret = collect_all('flask')
-datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
-tmp_ret = collect_all('flask_cors')
-datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
-tmp_ret = collect_all('openpyxl')
-datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
+hiddenimports = ['flask', 'flask_cors', 'openpyxl', 'tkinter', 'tkinter.font', 'socket', 'webbrowser', 'threading', 'queue', 'et_xmlfile', 'jdcal', 'lxml.etree']
+for pkg in ['flask', 'flask_cors']:
+    hiddenimports += collect_submodules(pkg)
+for pkg in ['flask']:
+    datas += collect_data_files(pkg)
 
 
 a = Analysis(
@@ -21,31 +41,37 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['numpy', 'pandas', 'scipy', 'matplotlib', 'PIL', 'pytest', 'setuptools', 'pip', 'tests', 'tkinter.test', 'unittest', 'email.test', 'distutils', 'tkinter.tix', 'turtle', 'idlelib', 'lib2to3', 'pydoc_data'],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='AdvantageScraper',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=False,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-    icon=['icon.ico'],
-    version='version_info.txt',
-)
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='AdvantageScraper',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip_binaries,
+    upx=True,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=['icon.ico'],
+    version='version_info.txt',
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=strip_binaries,
+    upx=True,
+    upx_exclude=['vcruntime140.dll', 'python3*.dll'],
+    name='AdvantageScraper',
+)
@@ -2,10 +2,85 @@ import PyInstaller.__main__
 import os
 import sys
 import shutil
+import hashlib
+import argparse
+import glob
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 # Central app version (keep in sync with manifest and main.py)
 VERSION = "2.1.1"
 
+DATA_FILES = [('icon.png', '.'), ('icon.ico', '.')]
+
+# Hidden imports shared by every profile (some are defensive to avoid rare hook gaps)
+COMMON_HIDDEN_IMPORTS = [
+    'flask', 'flask_cors', 'openpyxl', 'tkinter', 'tkinter.font', 'socket',
+    'webbrowser', 'threading', 'queue', 'et_xmlfile', 'jdcal', 'lxml.etree',
+]
+
+# Packages whose submodules / data files are collected explicitly. openpyxl
+# is covered by its own hook plus the et_xmlfile/jdcal hidden imports.
+COLLECT_SUBMODULES = ['flask', 'flask_cors']
+COLLECT_DATA = ['flask']
+
+# Leave the MSVC runtime and Python DLLs uncompressed
+UPX_EXCLUDE = ['vcruntime140.dll', 'python3*.dll']
+
+# Bytecode optimization for bundled modules (2 == python -OO: no asserts/docstrings).
+# Analysis(optimize=...) only exists from PyInstaller 6.6; older versions drop it silently.
+OPTIMIZE_LEVEL = 2
+MIN_PYINSTALLER = (6, 6)
+
+# Packages excluded from the bundle (see build/AdvantageScraper/xref-*.html)
+EXCLUDED_MODULES = [
+    'numpy', 'pandas', 'scipy', 'matplotlib', 'PIL', 'pytest',
+    'setuptools', 'pip', 'tests', 'tkinter.test', 'unittest',
+    'email.test', 'distutils',
+    # Standard-library extras pulled in by the tkinter hook
+    'tkinter.tix', 'turtle', 'idlelib', 'lib2to3', 'pydoc_data',
+]
+
+@dataclass
+class BuildProfile:
+    """PyInstaller settings for one executable built from this repo."""
+    name: str
+    script: str = 'main.py'
+    icon: str = 'icon.ico'
+    data_files: list = field(default_factory=lambda: list(DATA_FILES))
+    hidden_imports: list = field(default_factory=lambda: list(COMMON_HIDDEN_IMPORTS))
+    collect_submodules: list = field(default_factory=lambda: list(COLLECT_SUBMODULES))
+    collect_data: list = field(default_factory=lambda: list(COLLECT_DATA))
+    excludes: list = field(default_factory=lambda: list(EXCLUDED_MODULES))
+
+    @property
+    def spec_file(self):
+        # Generated spec; reusing it lets PyInstaller keep its Analysis cache
+        return f'{self.name}.spec'
+
+    @property
+    def dist_dir(self):
+        return os.path.join('dist', self.name)
+
+# All profiles share one build/ directory, so common analysis is cached once
+PROFILES = {
+    'advantage': BuildProfile(name='AdvantageScraper'),
+}
+
+def _write_if_changed(path: str, content: str):
+    """Write content to path unless the file already holds exactly that content.
+
+    Leaving the file untouched keeps its mtime, so PyInstaller does not treat
+    it as modified.
+    """
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            existing = f.read()
+        if hashlib.md5(existing.encode('utf-8')).digest() == hashlib.md5(content.encode('utf-8')).digest():
+            return
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
 def _write_version_file(path: str, version: str):
     """Generate a Windows version info file for PyInstaller."""
     parts = [int(p) for p in (version.split('.'))]
@@ -41,63 +116,183 @@ VSVersionInfo(
   ]
 )
 """
-    with open(path, 'w', encoding='utf-8') as f:
-        f.write(content)
+    _write_if_changed(path, content)
 
-def build_exe():
-    """Build standalone executable"""
-    # Clean previous builds
-    if os.path.exists('dist'):
-        shutil.rmtree('dist')
-    if os.path.exists('build'):
-        shutil.rmtree('build')
-    
+def _write_spec_file(profile: BuildProfile, version_file: str):
+    """Generate the PyInstaller spec file for a build profile."""
+    content = f"""# -*- mode: python ; coding: utf-8 -*-
+# Generated by build.py - edit the profile in build.py instead of this file.
+import os
+import sys
+import shutil
+from PyInstaller.utils.hooks import collect_data_files, collect_submodules
+
+# Strip debug symbols when a strip tool exists, except on Windows where a
+# stray MinGW strip can corrupt signed DLLs and the bootloader
+strip_binaries = sys.platform != 'win32' and shutil.which('strip') is not None
+
+# CI artifacts are re-compressed by the installer, so store the PYZ
+# uncompressed there to save build time (zlib level 0). This is a private
+# PyInstaller attribute, so skip it loudly if a newer version renamed it.
+# build.py gives CI builds their own work path so the cached PYZ never mixes.
+if os.environ.get('CI'):
+    try:
+        from PyInstaller.archive.writers import ZlibArchiveWriter
+    except ImportError:
+        ZlibArchiveWriter = None
+    if hasattr(ZlibArchiveWriter, '_COMPRESSION_LEVEL'):
+        ZlibArchiveWriter._COMPRESSION_LEVEL = 0
+    else:
+        print('WARNING: ZlibArchiveWriter._COMPRESSION_LEVEL not found; PYZ stays compressed')
+
+datas = {profile.data_files!r}
+binaries = []
+hiddenimports = {profile.hidden_imports!r}
+for pkg in {profile.collect_submodules!r}:
+    hiddenimports += collect_submodules(pkg)
+for pkg in {profile.collect_data!r}:
+    datas += collect_data_files(pkg)
+
+
+a = Analysis(
+    [{profile.script!r}],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={profile.excludes!r},
+    noarchive=False,
+    optimize={OPTIMIZE_LEVEL},
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name={profile.name!r},
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=strip_binaries,
+    upx=True,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon=[{profile.icon!r}],
+    version={version_file!r},
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=strip_binaries,
+    upx=True,
+    upx_exclude={UPX_EXCLUDE!r},
+    name={profile.name!r},
+)
+"""
+    _write_if_changed(profile.spec_file, content)
+
+def _prune_dist_tree(root: str):
+    """Remove type stubs, bundled tests and bytecode caches from the onedir output."""
+    for dirpath, dirnames, filenames in os.walk(root, topdown=True):
+        for d in list(dirnames):
+            if d in ('tests', '__pycache__'):
+                shutil.rmtree(os.path.join(dirpath, d), ignore_errors=True)
+                dirnames.remove(d)
+        for f in filenames:
+            if f.endswith('.pyi'):
+                os.remove(os.path.join(dirpath, f))
+
+def _old_copies(path):
+    """Return trees an earlier run renamed aside from path but failed to delete"""
+    return glob.glob(glob.escape(path) + '.old-*')
+
+def _remove_dirs(paths, leftovers=()):
+    """Delete directories concurrently.
+
+    Each directory is first renamed aside (atomic on the same volume) so the
+    original path is free immediately, then the renamed trees are removed in
+    parallel. leftovers are deleted in place without renaming. Anything that
+    still exists afterwards (e.g. a file locked by a running exe) is reported.
+    """
+    doomed = list(leftovers)
+    for path in paths:
+        # Not memoized: each path is checked once per build, and the renames
+        # below would make a cached answer stale
+        if not os.path.exists(path):
+            continue
+        old = f"{path}.old-{os.getpid()}"
+        try:
+            os.rename(path, old)
+        except OSError:
+            old = path
+        doomed.append(old)
+    if not doomed:
+        return
+    with ThreadPoolExecutor(max_workers=len(doomed)) as ex:
+        list(ex.map(lambda p: shutil.rmtree(p, ignore_errors=True), doomed))
+    for path in doomed:
+        if os.path.exists(path):
+            print(f"Warning: could not remove {path}; it will be retried next build")
+
+def build_exe(profile: BuildProfile = PROFILES['advantage'], clean: bool = False):
+    """Build standalone executable
+
+    build/ (build-ci/ when CI is set) is kept between runs so PyInstaller can
+    reuse its cache; pass clean=True to wipe it (e.g. when the cache is corrupt).
+    """
+    exe_path = os.path.abspath(os.path.join(profile.dist_dir, profile.name + '.exe'))
+
+    installed = tuple(int(p) for p in PyInstaller.__version__.split('.')[:2])
+    if installed < MIN_PYINSTALLER:
+        sys.exit(f"PyInstaller {PyInstaller.__version__} ignores optimize={OPTIMIZE_LEVEL}; "
+                 f"install PyInstaller >= {'.'.join(map(str, MIN_PYINSTALLER))} (see requirements.txt)")
+
+    # CI builds store the PYZ uncompressed, so they get their own cache
+    work_dir = 'build-ci' if os.environ.get('CI') else 'build'
+
+    # Clean previous output, plus trees earlier runs could not delete
+    _remove_dirs([profile.dist_dir, work_dir] if clean else [profile.dist_dir],
+                 leftovers=_old_copies(profile.dist_dir) + _old_copies(work_dir))
+
     # Ensure version file exists and matches VERSION
     version_file = 'version_info.txt'
     _write_version_file(version_file, VERSION)
-
-    data_sep = ';' if os.name == 'nt' else ':'
-    add_icon_png = f"--add-data=icon.png{data_sep}."
-    add_icon_ico = f"--add-data=icon.ico{data_sep}."
+    _write_spec_file(profile, version_file)
 
     args = [
-        'main.py',
-        '--name=AdvantageScraper',
-        '--onefile',
-        '--windowed',
-        '--icon=icon.ico',
-        '--clean',
-        f'--version-file={version_file}',
-        add_icon_png,
-        add_icon_ico,
-        # Hidden imports (some are defensive to avoid rare hook gaps)
-        '--hidden-import=flask',
-        '--hidden-import=flask_cors',
-        '--hidden-import=openpyxl',
-        '--hidden-import=tkinter',
-        '--hidden-import=tkinter.font',
-        '--hidden-import=socket',
-        '--hidden-import=webbrowser',
-        '--hidden-import=threading',
-        '--hidden-import=queue',
-        '--hidden-import=et_xmlfile',
-        '--hidden-import=jdcal',
-        # Collect packages with data and submodules
-        '--collect-all=flask',
-        '--collect-all=flask_cors',
-        '--collect-all=openpyxl',
+        profile.spec_file,
+        f'--upx-dir={os.environ.get("UPX_DIR", "upx")}',
+        f'--workpath={work_dir}',
         '--noconfirm'
     ]
+    if clean:
+        args.append('--clean')
 
     print('Running PyInstaller with args:')
     for a in args:
         print(' ', a)
     PyInstaller.__main__.run(args)
+    _prune_dist_tree(profile.dist_dir)
 
     print("\n" + "="*50)
     print("Build complete!")
-    print(f"Executable location: {os.path.abspath('dist/AdvantageScraper.exe')}")
+    print(f"Executable location: {exe_path}")
     print("="*50)
 
 if __name__ == "__main__":
-    build_exe()
+    parser = argparse.ArgumentParser(description='Build executables with PyInstaller')
+    parser.add_argument('profile', nargs='?', default='advantage', choices=sorted(PROFILES),
+                        help='Build profile to use (default: advantage)')
+    parser.add_argument('--clean', action='store_true',
+                        help='Remove build/ and PyInstaller caches before building')
+    cli_args = parser.parse_args()
+    build_exe(PROFILES[cli_args.profile], clean=cli_args.clean)
@@ -1,53 +1,60 @@
 """
 Diagnostic script to check date formats in Excel file
 """
-import openpyxl
+import sys
 from datetime import datetime
+from openpyxl import load_workbook
 
-# Open the Excel file
+# Read-only mode streams the sheet, so only row 2 is parsed instead of the whole
+# workbook; formulas come back as written, like the regular loader
 file_path = 'MML.xlsm'
-workbook = openpyxl.load_workbook(file_path, read_only=False, keep_vba=True)
+workbook = load_workbook(file_path, read_only=True)
 sheet = workbook["Purchase Parts"]
+row = next(sheet.iter_rows(min_row=2, max_row=2, max_col=15))
+
+# Report lines are collected and written to stdout in one go
+out = []
 
 # Check row 2 (first data row after header)
-print("=" * 80)
-print("ROW 2 INSPECTION (First Data Row)")
-print("=" * 80)
+out.append("=" * 80)
+out.append("ROW 2 INSPECTION (First Data Row)")
+out.append("=" * 80)
 
-row = sheet[2]
-for idx, cell in enumerate(row[:15], start=1):
+for idx, cell in enumerate(row, start=1):
     value = cell.value
-    value_type = type(value).__name__
     number_format = cell.number_format
+    value_type = type(value).__name__
 
     # Special attention to date columns (11 and 14 in 1-indexed)
     if idx in [11, 14]:  # Date columns
-        print(f"\n*** Column {idx} (Date Field) ***")
-        print(f"  Raw Value: {repr(value)}")
-        print(f"  Python Type: {value_type}")
-        print(f"  Excel Number Format: {number_format}")
-        print(f"  Is datetime object: {isinstance(value, datetime)}")
+        out.append(f"\n*** Column {idx} (Date Field) ***")
+        out.append(f"  Raw Value: {repr(value)}")
+        out.append(f"  Python Type: {value_type}")
+        out.append(f"  Excel Number Format: {number_format}")
+        out.append(f"  Is datetime object: {isinstance(value, datetime)}")
     else:
-        print(f"\nColumn {idx}:")
-        print(f"  Value: {value}")
-        print(f"  Type: {value_type}")
-        print(f"  Number Format: {number_format}")
+        out.append(f"\nColumn {idx}:")
+        out.append(f"  Value: {value}")
+        out.append(f"  Type: {value_type}")
+        out.append(f"  Number Format: {number_format}")
 
-print("\n" + "=" * 80)
-print("WHAT THE CODE IS CURRENTLY DOING")
-print("=" * 80)
+out.append("\n" + "=" * 80)
+out.append("WHAT THE CODE IS CURRENTLY DOING")
+out.append("=" * 80)
 
 # Show what the code does
 test_date_string = datetime.now().strftime("%m/%d/%Y")
-print(f"\nCurrent code writes: {repr(test_date_string)}")
-print(f"Type: {type(test_date_string).__name__}")
-print(f"This is a STRING, not a datetime object!")
-
-print("\n" + "=" * 80)
-print("WHAT IT SHOULD BE")
-print("=" * 80)
-print(f"\nShould write: datetime.now()")
-print(f"Type: {type(datetime.now()).__name__}")
-print(f"Excel will automatically format this as a date")
+out.append(f"\nCurrent code writes: {repr(test_date_string)}")
+out.append(f"Type: {type(test_date_string).__name__}")
+out.append(f"This is a STRING, not a datetime object!")
+
+out.append("\n" + "=" * 80)
+out.append("WHAT IT SHOULD BE")
+out.append("=" * 80)
+out.append(f"\nShould write: datetime.now()")
+out.append(f"Type: {type(datetime.now()).__name__}")
+out.append(f"Excel will automatically format this as a date")
+
+sys.stdout.write("\n".join(out) + "\n")
 
 workbook.close()
@@ -1,45 +1,80 @@
 """
 Check date formats across multiple rows
 """
+import sys
+import argparse
+import zipfile
 import openpyxl
 from datetime import datetime
 
+parser = argparse.ArgumentParser(description=__doc__.strip())
+parser.add_argument('--with-vba', action='store_true', help='Also load the VBA project (slower)')
+args = parser.parse_args()
+
+def has_vba(path):
+    """Check the zip directory for a VBA project without loading the workbook"""
+    with zipfile.ZipFile(path) as z:
+        return 'xl/vbaProject.bin' in z.namelist()
+
 # Open the Excel file
 file_path = 'MML.xlsm'
-workbook = openpyxl.load_workbook(file_path, read_only=False, keep_vba=True)
+# Read-only streaming mode: these scripts never write back to the workbook
+workbook = openpyxl.load_workbook(file_path, read_only=True, keep_vba=args.with_vba and has_vba(file_path))
 sheet = workbook["Purchase Parts"]
 
-print("=" * 80)
-print("CHECKING DATE COLUMNS (11 and 14) ACROSS MULTIPLE ROWS")
-print("=" * 80)
+# Report lines are collected and written to stdout in one go
+out = []
+
+out.append("=" * 80)
+out.append("CHECKING DATE COLUMNS (11 and 14) ACROSS MULTIPLE ROWS")
+out.append("=" * 80)
+
+# Cell values come from a small closed set of types; map them to names directly
+TYPE_NAMES = {datetime: 'datetime', str: 'str', int: 'int', float: 'float', bool: 'bool', type(None): 'NoneType'}
 
-# Check first 20 rows
-for row_num in range(2, min(22, sheet.max_row + 1)):
-    row = sheet[row_num]
+# Rows sharing a (type, format) signature for both columns are only printed once
+HOMOGENEOUS_ROWS = 3  # stop early once this many rows all share one signature
+signature_counts = {}
+rows_checked = 0
 
+# Check first 20 rows, reading only columns 11-14
+rows = sheet.iter_rows(min_row=2, max_row=21, min_col=11, max_col=14)
+for row_num, (date_cell, _, _, last_date_cell) in enumerate(rows, start=2):
     # Column 11 (index 10) - Date field
-    date_cell = row[10]
     date_value = date_cell.value
-    date_type = type(date_value).__name__
+    date_type = TYPE_NAMES.get(type(date_value)) or type(date_value).__name__
     date_format = date_cell.number_format
 
     # Column 14 (index 13) - Last Updated Date field
-    last_date_cell = row[13]
     last_date_value = last_date_cell.value
-    last_date_type = type(last_date_value).__name__
+    last_date_type = TYPE_NAMES.get(type(last_date_value)) or type(last_date_value).__name__
     last_date_format = last_date_cell.number_format
 
-    print(f"\nRow {row_num}:")
-    print(f"  Col 11 (Date): value={repr(date_value)[:40]}, type={date_type}, format={date_format}")
-    print(f"  Col 14 (Last Date): value={repr(last_date_value)[:40]}, type={last_date_type}, format={last_date_format}")
+    rows_checked += 1
+    sig = ((date_type, date_format), (last_date_type, last_date_format))
+    if sig not in signature_counts:
+        signature_counts[sig] = 0
+        out.append(f"\nRow {row_num}:")
+        out.append(f"  Col 11 (Date): value={date_value!r:.40}, type={date_type}, format={date_format}")
+        out.append(f"  Col 14 (Last Date): value={last_date_value!r:.40}, type={last_date_type}, format={last_date_format}")
+    signature_counts[sig] += 1
+
+    if rows_checked >= HOMOGENEOUS_ROWS and len(signature_counts) == 1:
+        break
 
 workbook.close()
 
-print("\n" + "=" * 80)
-print("SUMMARY")
-print("=" * 80)
-print("\nKEY FINDINGS:")
-print("1. Check if existing dates are stored as datetime objects or strings")
-print("2. Check the number_format applied to date columns")
-print("3. The code currently writes strings like '10/14/2025'")
-print("4. It SHOULD write datetime objects like: datetime(2025, 10, 14)")
+out.append(f"\nChecked {rows_checked} rows, {len(signature_counts)} distinct type/format combination(s):")
+for ((date_type, date_format), (last_date_type, last_date_format)), count in signature_counts.items():
+    out.append(f"  {count:>3} rows: Col 11 {date_type} [{date_format}] | Col 14 {last_date_type} [{last_date_format}]")
+
+out.append("\n" + "=" * 80)
+out.append("SUMMARY")
+out.append("=" * 80)
+out.append("\nKEY FINDINGS:")
+out.append("1. Check if existing dates are stored as datetime objects or strings")
+out.append("2. Check the number_format applied to date columns")
+out.append("3. The code currently writes strings like '10/14/2025'")
+out.append("4. It SHOULD write datetime objects like: datetime(2025, 10, 14)")
+
+sys.stdout.write("\n".join(out) + "\n")
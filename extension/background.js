@@ -85,6 +85,9 @@ function startClosePolling(tabId) {
         // Close the tab
         chrome.tabs.remove(tabId);
         stopClosePolling(tabId);
+      } else if (data && data.navigateTo) {
+        // Reuse this tab for the next part of a batch run
+        chrome.tabs.update(tabId, { url: data.navigateTo });
       }
     } catch (_) {
       // ignore polling errors
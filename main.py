@@ -1,20 +1,45 @@
 import os
+import re
 import sys
 import argparse
 
 import time
 import queue
+import json
+import atexit
+import pickle
+import sqlite3
+import shutil
+import stat
+import socket
+import hashlib
+import getpass
+import functools
+import itertools
+import tempfile
 import logging
 import threading
 import webbrowser
 import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from copy import copy
+from contextlib import closing
+from urllib.parse import urlsplit
 import tkinter as tk
 from tkinter import simpledialog, messagebox, scrolledtext
 import tkinter.font as tkFont
 from datetime import datetime, date
 from openpyxl import load_workbook
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from werkzeug.serving import make_server, WSGIRequestHandler
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to Flask's stdlib json provider
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -39,7 +64,7 @@ def set_window_icon_safe(window, icon_ico_path=None, icon_png_path=None):
             # Store reference on window itself, not global
             window._icon_ref = icon
     except Exception as e:
-        logger.warning(f"Could not set window icon: {e}")
+        logger.warning("Could not set window icon: %s", e)
 
 # Error Handling
 def handle_error(exception, context="", show_user=True, parent_window=None, log_level="error"):
@@ -60,11 +85,11 @@ def handle_error(exception, context="", show_user=True, parent_window=None, log_
 
     # Log technical error
     if log_level == "error":
-        logger.error(f"{context}: {exception}", exc_info=True)
+        logger.error("%s: %s", context, exception, exc_info=True)
     elif log_level == "warning":
-        logger.warning(f"{context}: {exception}")
+        logger.warning("%s: %s", context, exception)
     else:
-        logger.info(f"{context}: {exception}")
+        logger.info("%s: %s", context, exception)
 
     # Show user-friendly message
     if show_user:
@@ -78,10 +103,25 @@ def handle_error(exception, context="", show_user=True, parent_window=None, log_
 
 # Global configuration
 SERVER_PORT = 5000
+SERVER_SOCKET_TIMEOUT = 10  # Seconds an idle extension connection may hold a server thread
 DATA_QUEUE = queue.Queue(maxsize=50)  # Limit queue size to prevent unbounded growth
+QUEUE_PUT_LOCK = threading.Lock()  # Makes queue_scraped_data's drop-oldest-then-put atomic across server threads
 FLASK_APP = None
+FLASK_SERVER = None
 TABS_TO_CLOSE = set()  # Track tabs that should be closed
-REGISTERED_TABS = {}  # Track all open tabs {tabId: {'url': url, 'timestamp': time.time()}}
+TABS_TO_NAVIGATE = {}  # Tabs to load a new page in {tabId: url}, handed out by /should-close
+REGISTERED_TABS = {}  # Track all open tabs {tabId: {'url': url, 'timestamp': time.monotonic()}}, oldest first
+TABS_LOCK = threading.RLock()  # Guards TABS_TO_CLOSE, TABS_TO_NAVIGATE and REGISTERED_TABS (server thread vs GUI/batch threads)
+PENDING_PARTS = {}  # Batch scrapes in flight {normalized part #: queue.Queue}
+PENDING_PARTS_LOCK = threading.Lock()
+BATCH_SCRAPE_WORKERS = 4  # Vendor pages scraped concurrently during batch updates
+# Close the batch summary on its own after this many ms, so chained/scripted
+# runs aren't held up by it (unset or 0: it stays open until closed)
+try:
+    BATCH_SUMMARY_AUTOCLOSE_MS = int(os.environ.get('BATCH_SUMMARY_AUTOCLOSE_MS') or 0) or None
+except ValueError:
+    BATCH_SUMMARY_AUTOCLOSE_MS = None
+BATCH_SUMMARY_MAX_CHARS = 500_000  # Longer summaries show only their end; the full text goes to a file
 
 # Schema fields
 FIELDS = [
@@ -91,6 +131,15 @@ FIELDS = [
 
 ]
 
+# Position of each field in a row list (current_data / entry_data / Excel columns - 1)
+(COL_ACI, COL_MFR_PART, COL_MFR, COL_DESCRIPTION, COL_QTY, COL_PER,
+ COL_VENDOR, COL_VENDOR_PART, COL_LEGACY, COL_UNIT_PRICE, COL_DATE,
+ COL_CHANGE, COL_LAST_PRICE, COL_LAST_DATE, COL_PRICE_HISTORY) = range(len(FIELDS))
+PRICE_COLUMNS = (COL_UNIT_PRICE, COL_LAST_PRICE)
+DATE_COLUMNS = (COL_DATE, COL_LAST_DATE)
+# Unit Price placeholders that can't be compared for a price change
+PRICE_SENTINELS = frozenset({'Legacy', 'None', None})
+
 VENDOR_URLS = {
     'grainger': 'https://www.grainger.com/product/{}/',
     'mcmaster-carr': 'https://www.mcmaster.com/{}/',
@@ -98,27 +147,54 @@ VENDOR_URLS = {
     'festo': 'https://www.festo.com/us/en/a/{}',
     'zoro': 'https://www.zoro.com/i/{}/'
 }
+# Vendor keys whose part numbers differ from the MFR part # (checked in batch mode)
+MCMASTER_VENDORS = frozenset({'mcmaster', 'mcmaster-carr'})
+# Bound str.format per vendor, so building a URL is a single call
+VENDOR_URL_BUILDERS = {vendor: url.format for vendor, url in VENDOR_URLS.items()}
+
+# Precompiled patterns for vendor data cleanup
+NON_DIGIT_RE = re.compile(r'\D')
+NON_ALNUM_RE = re.compile(r'[^0-9a-z]')
+NON_PRICE_RE = re.compile(r'[^\d.]')
+NEWLINE_RE = re.compile(r'\r?\n')
+# Separators in the batch ACI list (one per line or comma-separated)
+ACI_LIST_SPLIT_RE = re.compile(r'[\n,]+')
 
 # Excel column number formats (0-indexed)
 COLUMN_FORMATS = {
-    9: r'_("$"* #,##0.00_);_("$"* \(#,##0.00\);_("$"* "-"??_);_(@_)',  # Unit Price (col 10)
-    10: 'mm-dd-yy',  # Date (col 11)
-    12: r'_("$"* #,##0.00_);_("$"* \(#,##0.00\);_("$"* "-"??_);_(@_)',  # Last Updated Price (col 13)
-    13: 'mm-dd-yy',  # Last Updated Date (col 14)
+    COL_UNIT_PRICE: r'_("$"* #,##0.00_);_("$"* \(#,##0.00\);_("$"* "-"??_);_(@_)',  # Unit Price (col 10)
+    COL_DATE: 'mm-dd-yy',  # Date (col 11)
+    COL_LAST_PRICE: r'_("$"* #,##0.00_);_("$"* \(#,##0.00\);_("$"* "-"??_);_(@_)',  # Last Updated Price (col 13)
+    COL_LAST_DATE: 'mm-dd-yy',  # Last Updated Date (col 14)
 }
 
 #
 # FLASK SERVER
 #
+def pop_stale_tabs(max_age_seconds):
+    """Unregister tabs older than max_age_seconds and return their IDs"""
+    # Tabs are re-inserted on every registration, so REGISTERED_TABS stays in
+    # timestamp order and the scan can stop at the first fresh tab
+    cutoff = time.monotonic() - max_age_seconds
+    stale_tabs = []
+    with TABS_LOCK:
+        while REGISTERED_TABS:
+            tab_id, info = next(iter(REGISTERED_TABS.items()))
+            if info['timestamp'] >= cutoff:
+                break
+            del REGISTERED_TABS[tab_id]
+            stale_tabs.append(tab_id)
+    return stale_tabs
+
 def cleanup_stale_tabs(max_age_seconds=1800):
     """Remove tabs that haven't been cleaned up properly (older than 30 minutes)"""
-    current_time = time.time()
-    stale_tabs = [tab_id for tab_id, info in REGISTERED_TABS.items()
-                  if current_time - info['timestamp'] > max_age_seconds]
+    with TABS_LOCK:
+        stale_tabs = pop_stale_tabs(max_age_seconds)
+        TABS_TO_CLOSE.difference_update(stale_tabs)
+        for tab_id in stale_tabs:
+            TABS_TO_NAVIGATE.pop(tab_id, None)
     for tab_id in stale_tabs:
-        REGISTERED_TABS.pop(tab_id, None)
-        TABS_TO_CLOSE.discard(tab_id)
-        logger.info(f"Cleaned up stale tab {tab_id}")
+        logger.info("Cleaned up stale tab %s", tab_id)
 
 def clear_stale_data():
     """Clear stale data before new scraping operation"""
@@ -129,21 +205,117 @@ def clear_stale_data():
         except queue.Empty:
             break
 
-    # Clear tabs to close
-    TABS_TO_CLOSE.clear()
+    with TABS_LOCK:
+        # Clear tabs to close or navigate
+        TABS_TO_CLOSE.clear()
+        TABS_TO_NAVIGATE.clear()
 
-    # Remove old registered tabs (older than 5 seconds)
-    current_time = time.time()
-    stale_tabs = [tab_id for tab_id, info in REGISTERED_TABS.items()
-                  if current_time - info['timestamp'] > 5]
-    for tab_id in stale_tabs:
-        REGISTERED_TABS.pop(tab_id, None)
+        # Remove old registered tabs (older than 5 seconds)
+        pop_stale_tabs(5)
 
     logger.info("Cleared stale data and old tab registrations")
 
+def part_key(part_number):
+    """Normalize a vendor part number for matching scraped data to its request"""
+    return NON_ALNUM_RE.sub('', str(part_number or '').lower())
+
+def register_pending_part(part_number):
+    """Register a batch scrape in flight and return the queue its data will land in"""
+    pending = queue.Queue(maxsize=1)
+    with PENDING_PARTS_LOCK:
+        PENDING_PARTS[part_key(part_number)] = pending
+    return pending
+
+def unregister_pending_part(part_number):
+    """Stop routing scraped data for a batch part"""
+    with PENDING_PARTS_LOCK:
+        PENDING_PARTS.pop(part_key(part_number), None)
+
+def match_pending_part(data):
+    """Return the pending batch queue scraped data belongs to, or None"""
+    with PENDING_PARTS_LOCK:
+        if not PENDING_PARTS:
+            return None
+
+        # Exact part # first, then a page URL path segment equal to a pending part #
+        # (VENDOR_URLS put it there); never substrings, so short part #s can't mis-route
+        key = part_key(data.get('partNumber'))
+        if key and key in PENDING_PARTS:
+            return PENDING_PARTS[key]
+        for segment in urlsplit(str(data.get('url') or '')).path.split('/'):
+            key = part_key(segment)
+            if key and key in PENDING_PARTS:
+                return PENDING_PARTS[key]
+    return None
+
+def find_tab_for_part(part_number):
+    """Return the most recent registered tab whose URL contains the part number"""
+    key = part_key(part_number)
+    if not key:
+        return None
+    with TABS_LOCK:
+        tabs = [(info['timestamp'], tab_id) for tab_id, info in REGISTERED_TABS.items()
+                if key in part_key(info.get('url'))]
+    return max(tabs)[1] if tabs else None
+
+def most_recent_tab():
+    """Return the most recently registered tab ID, or None if none are registered"""
+    with TABS_LOCK:
+        return next(reversed(REGISTERED_TABS), None)
+
+def request_tab_close(tab_id):
+    """Queue a tab to be closed the next time the extension polls /should-close"""
+    with TABS_LOCK:
+        TABS_TO_CLOSE.add(tab_id)
+
+def request_tab_navigate(tab_id, url):
+    """Queue a page load in an open tab, returning False if the tab is no longer registered"""
+    with TABS_LOCK:
+        if tab_id not in REGISTERED_TABS or tab_id in TABS_TO_CLOSE:
+            return False
+        TABS_TO_NAVIGATE[tab_id] = url
+    return True
+
+def queue_scraped_data(data):
+    """Deliver scraped data to its pending batch part, else to the shared DATA_QUEUE"""
+    target = match_pending_part(data) or DATA_QUEUE
+    # The server is threaded (make_server(threaded=True)), so several /scrape
+    # requests can reach a full queue at once; QUEUE_PUT_LOCK keeps another
+    # producer from taking the slot freed by get_nowait before our put
+    with QUEUE_PUT_LOCK:
+        try:
+            target.put(data, block=False)
+        except queue.Full:
+            logger.warning("Queue full, discarding oldest item")
+            try:
+                target.get_nowait()  # Remove oldest
+            except queue.Empty:
+                pass
+            target.put(data, block=False)  # Add new
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson for request parsing and responses"""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj), mimetype='application/json')
+
+# Body of the /scrape success response, built once
+SCRAPE_OK_BODY = b'{"status":"success"}'
+
 def create_flask_app():
     app = Flask(__name__)
-    CORS(app)
+    if orjson is not None:
+        app.json = OrjsonProvider(app)
+    # Only the extension (background worker / popup) talks to this server, and
+    # only with GET/POST. Unpacked installs each get their own ID, hence the pattern.
+    CORS(app, origins=[r"chrome-extension://.*"], methods=['GET', 'POST'])
     
     @app.after_request
     def add_private_network_header(response):
@@ -161,19 +333,11 @@ def create_flask_app():
     def receive_scrape():
         try:
             data = request.json
-            logger.info(f"Received data from extension: {data.get('vendor')} - {data.get('partNumber')} (Tab ID: {data.get('tabId')})")
-            try:
-                DATA_QUEUE.put(data, block=False)
-            except queue.Full:
-                logger.warning("Queue full, discarding oldest item")
-                try:
-                    DATA_QUEUE.get_nowait()  # Remove oldest
-                except queue.Empty:
-                    pass
-                DATA_QUEUE.put(data, block=False)  # Add new
-            return jsonify({"status": "success"}), 200
+            logger.info("Received data from extension: %s - %s (Tab ID: %s)", data.get('vendor'), data.get('partNumber'), data.get('tabId'))
+            queue_scraped_data(data)
+            return app.response_class(SCRAPE_OK_BODY, status=200, mimetype='application/json')
         except Exception as e:
-            logger.error(f"Error receiving data: {e}")
+            logger.error("Error receiving data: %s", e)
             return jsonify({"status": "error", "message": str(e)}), 500
 
     @app.route('/register-tab', methods=['POST'])
@@ -184,25 +348,35 @@ def create_flask_app():
             tab_id = data.get('tabId')
             url = data.get('url', 'unknown')
             if tab_id:
-                REGISTERED_TABS[tab_id] = {'url': url, 'timestamp': time.time()}
-                logger.info(f"Tab {tab_id} registered: {url}")
+                with TABS_LOCK:
+                    # Move a re-registered tab to the end to keep timestamp order
+                    REGISTERED_TABS.pop(tab_id, None)
+                    REGISTERED_TABS[tab_id] = {'url': url, 'timestamp': time.monotonic()}
+                logger.info("Tab %s registered: %s", tab_id, url)
 
                 # Clean up stale tabs older than 30 minutes
                 cleanup_stale_tabs()
             return jsonify({"status": "success"}), 200
         except Exception as e:
-            logger.error(f"Error registering tab: {e}")
+            logger.error("Error registering tab: %s", e)
             return jsonify({"status": "error"}), 500
 
     @app.route('/should-close/<int:tab_id>', methods=['GET'])
     def should_close_tab(tab_id):
-        """Check if a tab should be closed"""
-        should_close = tab_id in TABS_TO_CLOSE
+        """Check if a tab should be closed or load another page"""
+        with TABS_LOCK:
+            should_close = tab_id in TABS_TO_CLOSE
+            navigate_to = TABS_TO_NAVIGATE.pop(tab_id, None)
+            if should_close:
+                TABS_TO_CLOSE.discard(tab_id)  # Remove after checking
+                REGISTERED_TABS.pop(tab_id, None)  # Clean up registration
         if should_close:
-            TABS_TO_CLOSE.discard(tab_id)  # Remove after checking
-            REGISTERED_TABS.pop(tab_id, None)  # Clean up registration
-            logger.info(f"Signaling tab {tab_id} to close")
-        return jsonify({"shouldClose": should_close})
+            logger.info("Signaling tab %s to close", tab_id)
+            return jsonify({"shouldClose": True})
+        if navigate_to:
+            logger.info("Signaling tab %s to load %s", tab_id, navigate_to)
+            return jsonify({"shouldClose": False, "navigateTo": navigate_to})
+        return jsonify({"shouldClose": False})
 
     @app.route('/tab-closed', methods=['POST'])
     def tab_closed():
@@ -212,28 +386,45 @@ def create_flask_app():
             if data:
                 tab_id = data.get('tabId')
                 if tab_id:
-                    TABS_TO_CLOSE.discard(tab_id)  # Remove from close queue
-                    REGISTERED_TABS.pop(tab_id, None)  # Remove from registered tabs
-                    logger.info(f"Tab {tab_id} closed/cleaned up")
+                    with TABS_LOCK:
+                        TABS_TO_CLOSE.discard(tab_id)  # Remove from close queue
+                        TABS_TO_NAVIGATE.pop(tab_id, None)
+                        REGISTERED_TABS.pop(tab_id, None)  # Remove from registered tabs
+                    logger.info("Tab %s closed/cleaned up", tab_id)
             return '', 204  # No content response
         except Exception as e:
-            logger.error(f"Error handling tab closure: {e}")
+            logger.error("Error handling tab closure: %s", e)
             return '', 204  # Still return success to avoid client errors
 
     return app
 
+def port_in_use(port):
+    """Check whether the local server port is already taken, without connecting to it"""
+    # A refused connect_ex to a free port takes about 2s on Windows; a bind fails at once
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        if sys.platform != 'win32':
+            # POSIX: only skip TIME_WAIT leftovers from a previous run. On Windows
+            # this option would let the bind succeed over a live listener.
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(('127.0.0.1', port))
+    except OSError:
+        return True
+    finally:
+        sock.close()
+    return False
+
+class TimeoutRequestHandler(WSGIRequestHandler):
+    """Werkzeug request handler that closes connections idle for SERVER_SOCKET_TIMEOUT"""
+    timeout = SERVER_SOCKET_TIMEOUT
+
 def start_flask_server():
     """Start Flask server in background thread"""
-    global FLASK_APP
+    global FLASK_APP, FLASK_SERVER
 
     # Check if port is already in use
-    import socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    result = sock.connect_ex(('127.0.0.1', SERVER_PORT))
-    sock.close()
-
-    if result == 0:
-        logger.warning(f"Port {SERVER_PORT} is already in use. Another instance may be running.")
+    if port_in_use(SERVER_PORT):
+        logger.warning("Port %s is already in use. Another instance may be running.", SERVER_PORT)
         from tkinter import messagebox
         response = messagebox.askyesno(
             "Port Already in Use",
@@ -246,22 +437,29 @@ def start_flask_server():
 
     FLASK_APP = create_flask_app()
 
-    def run_server():
-        logger.info(f"Starting Flask server on port {SERVER_PORT}...")
-        try:
-            FLASK_APP.run(host='127.0.0.1', port=SERVER_PORT, debug=False, use_reloader=False, threaded=True)
-        except OSError as e:
-            logger.error(f"Failed to start server: {e}")
+    # Thread per connection, so one slow or idle tab can't stall /ping and the
+    # other tabs; idle sockets are dropped after SERVER_SOCKET_TIMEOUT. The socket
+    # is bound here, so the server is ready as soon as this returns.
+    logger.info("Starting Flask server on port %s...", SERVER_PORT)
+    try:
+        FLASK_SERVER = make_server('127.0.0.1', SERVER_PORT, FLASK_APP, threaded=True,
+                                   request_handler=TimeoutRequestHandler)
+    except OSError as e:
+        logger.error("Failed to start server: %s", e)
+        return
 
-    server_thread = threading.Thread(target=run_server, daemon=True)
+    server_thread = threading.Thread(target=FLASK_SERVER.serve_forever, daemon=True)
     server_thread.start()
-    time.sleep(1)  # Wait for server to start
     logger.info("Flask server started")
 
 #
 # BROWSER CONTROLLER
 #
 class BrowserController:
+    # Browser used for vendor pages, resolved once on first use
+    _browser = None
+    _browser_lock = threading.Lock()
+
     @staticmethod
     def find_chrome_path():
         """Dynamically find Chrome installation path"""
@@ -283,7 +481,7 @@ class BrowserController:
                         # Clean up path (remove quotes and arguments)
                         chrome_path = chrome_path.strip('"').split(' --')[0].split('.exe')[0] + '.exe'
                         if os.path.exists(chrome_path):
-                            logger.info(f"Found Chrome via registry: {chrome_path}")
+                            logger.info("Found Chrome via registry: %s", chrome_path)
                             return chrome_path
                     finally:
                         winreg.CloseKey(key)
@@ -301,7 +499,7 @@ class BrowserController:
 
             for path in common_paths:
                 if os.path.exists(path):
-                    logger.info(f"Found Chrome at: {path}")
+                    logger.info("Found Chrome at: %s", path)
                     return path
 
         elif sys.platform == 'darwin':
@@ -314,62 +512,128 @@ class BrowserController:
                 if os.path.exists(path):
                     return path
 
+        # Last resort: anything named like Chrome on PATH
+        for name in ('chrome', 'google-chrome', 'chromium-browser', 'chromium'):
+            path = shutil.which(name)
+            if path:
+                logger.info("Found Chrome on PATH: %s", path)
+                return path
+
         logger.warning("Chrome not found in any known location")
         return None
 
+    @classmethod
+    def get_browser(cls):
+        """Return the Chrome controller (or the default browser), looking Chrome up only once"""
+        with cls._browser_lock:
+            if cls._browser is None:
+                chrome_path = cls.find_chrome_path()
+                if chrome_path:
+                    webbrowser.register('chrome', None, webbrowser.BackgroundBrowser(chrome_path))
+                    cls._browser = webbrowser.get('chrome')
+                else:
+                    logger.warning("Chrome not found, using default browser")
+                    cls._browser = webbrowser.get()
+            return cls._browser
+
+    @staticmethod
+    def vendor_page_url(vendor_name, part_number):
+        """Build the product page URL for a vendor part, or None for an unknown vendor"""
+        build_url = VENDOR_URL_BUILDERS.get(vendor_name.lower().strip())
+        if build_url is None:
+            logger.error("Unknown vendor: %s", vendor_name)
+            return None
+        return build_url(part_number)
+
     @staticmethod
     def open_vendor_page(vendor_name, part_number):
         """Open vendor page in Chrome"""
-        vendor_key = vendor_name.lower().strip()
-
-        if vendor_key not in VENDOR_URLS:
-            logger.error(f"Unknown vendor: {vendor_name}")
+        url = BrowserController.vendor_page_url(vendor_name, part_number)
+        if url is None:
             return False
 
-        url = VENDOR_URLS[vendor_key].format(part_number)
-        logger.info(f"Opening {url} in Chrome...")
+        logger.info("Opening %s in Chrome...", url)
 
         try:
-            # Find Chrome dynamically
-            chrome_path = BrowserController.find_chrome_path()
-
-            if chrome_path:
-                webbrowser.register('chrome', None, webbrowser.BackgroundBrowser(chrome_path))
-                webbrowser.get('chrome').open(url)
-            else:
-                logger.warning("Chrome not found, using default browser")
-                webbrowser.open(url)
+            BrowserController.get_browser().open(url)
             return True
         except Exception as e:
-            logger.error(f"Failed to open browser: {e}")
+            logger.error("Failed to open browser: %s", e)
+            return False
+
+    @staticmethod
+    def navigate_in_existing_tab(vendor_name, part_number, tab_id):
+        """Load a vendor page in an already-open extension tab instead of a new one"""
+        url = BrowserController.vendor_page_url(vendor_name, part_number)
+        if url is None:
             return False
+
+        if not request_tab_navigate(tab_id, url):
+            logger.info("Tab %s is gone, opening a new one", tab_id)
+            return False
+        logger.info("Loading %s in tab %s...", url, tab_id)
+        return True
     
     @staticmethod
     def wait_for_scraped_data(timeout=15):
         """Wait for extension to send scraped data"""
-        logger.info(f"Waiting up to {timeout}s for scraped data...")
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            try:
-                data = DATA_QUEUE.get(timeout=0.5)
-                logger.info("Data received from extension")
-                return data
-            except queue.Empty:
-                continue
-        
-        logger.warning("Timeout waiting for scraped data")
-        return None
+        logger.debug("Waiting up to %ss for scraped data...", timeout)
+        try:
+            data = DATA_QUEUE.get(timeout=timeout)
+        except queue.Empty:
+            logger.warning("Timeout waiting for scraped data")
+            return None
+
+        logger.info("Data received from extension")
+        return data
 
 #
 # DATA PROCESSING
 #
+# Non-breaking space -> space, left-to-right mark removed
+SANITIZE_TABLE = str.maketrans({'\xa0': ' ', '\u200e': None})
+
 def sanitize_string(value):
     """Clean string data"""
-    if isinstance(value, str):
-        return value.replace('\xa0', ' ').replace('\u200e', '').strip()
+    # Exact type check: this runs once per cell on a full sheet scan
+    if value.__class__ is str:
+        return value.translate(SANITIZE_TABLE).strip()
     return value
 
+def canon_aci(value):
+    """Clean a typed or pasted ACI# into the upper-cased form every lookup expects"""
+    return sanitize_string(str(value)).upper()
+
+# Date string formats accepted from cells and the form, most common first
+DATE_STRING_FORMATS = ('%m/%d/%Y', '%Y-%m-%d', '%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M:%S')
+ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}:\d{2})?')
+US_DATE_RE = re.compile(r'([0-9]{2})/([0-9]{2})/([0-9]{4})')
+
+# Cached: a batch formats and saves the same few dates (today, common cell dates) over and over
+@functools.lru_cache(maxsize=1024)
+def parse_date_string(text):
+    """Parse a date string in one of DATE_STRING_FORMATS (None if none match)"""
+    # Dates the form and format_date_value produce are MM/DD/YYYY; build those directly
+    match = US_DATE_RE.fullmatch(text)
+    if match:
+        month, day, year = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+    # Zero-padded ISO dates (str() of a date cell) skip strptime's format parsing
+    if ISO_DATE_RE.fullmatch(text):
+        try:
+            return datetime.fromisoformat(text)
+        except ValueError:
+            pass
+    for fmt in DATE_STRING_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
 def format_date_value(value):
     """Format date value to MM/DD/YYYY string, handling date and datetime objects"""
     if value is None or value == '':
@@ -382,22 +646,15 @@ def format_date_value(value):
     # If it's already a string, try to parse and reformat it
     if isinstance(value, str):
         # If it already looks like MM/DD/YYYY, return it
-        if len(value) == 10 and value.count('/') == 2:
-            try:
-                # Validate it's a real date
-                datetime.strptime(value, "%m/%d/%Y")
-                return value
-            except ValueError:
-                pass
+        # (validating it's a real date)
+        if len(value) == 10 and value.count('/') == 2 and parse_date_string(value) is not None:
+            return value
 
         # Try to parse datetime string and reformat
         # Handle common formats including "2024-02-26 00:00:00" and "2024-02-26"
-        for fmt in ['%Y-%m-%d %H:%M:%S', '%m/%d/%Y %H:%M:%S', '%Y-%m-%d', '%m/%d/%Y']:
-            try:
-                parsed_date = datetime.strptime(str(value).split('.')[0].strip(), fmt)
-                return parsed_date.strftime("%m/%d/%Y")
-            except ValueError:
-                continue
+        parsed_date = parse_date_string(value.split('.')[0].strip())
+        if parsed_date is not None:
+            return parsed_date.strftime("%m/%d/%Y")
 
         # If parsing fails, return original
         return str(value)
@@ -417,7 +674,7 @@ def format_price_value(value):
     # Clean string and convert to float
     try:
         # Remove $, commas, and other non-numeric characters except decimal point
-        cleaned = ''.join(c for c in str(value) if c.isdigit() or c == '.')
+        cleaned = NON_PRICE_RE.sub('', str(value))
         return float(cleaned) if cleaned else None
     except (ValueError, AttributeError):
         return None
@@ -442,11 +699,9 @@ def prepare_date_for_excel(value):
             return None
 
         # Try to parse common date formats
-        for fmt in ['%m/%d/%Y', '%Y-%m-%d', '%m/%d/%Y %H:%M:%S', '%Y-%m-%d %H:%M:%S']:
-            try:
-                return datetime.strptime(value.strip(), fmt).date()
-            except ValueError:
-                continue
+        parsed_date = parse_date_string(value.strip())
+        if parsed_date is not None:
+            return parsed_date.date()
 
     # If we can't parse it, return None
     return None
@@ -500,15 +755,9 @@ def parse_vendor_data(raw_data, vendor_name):
     brand = raw_data.get('brand', 'Not Found')
     
     # Vendor-specific cleanup
-    if vendor_key == 'grainger':
-        price, unit, qty = cleanup_grainger_data(price_raw, unit, mfr_number)
-    elif vendor_key in ['mcmaster', 'mcmaster-carr']:
-        price, unit, qty = cleanup_mcmaster_data(price_raw, unit)
-        # For McMaster, don't replace MFR number - leave it empty if not found
-    elif vendor_key == 'festo':
-        price, unit, qty = cleanup_festo_data(price_raw, unit, raw_data.get('qty'))
-    elif vendor_key == 'zoro':
-        price, unit, qty = cleanup_zoro_data(price_raw, unit)
+    cleanup = VENDOR_CLEANUP.get(vendor_key)
+    if cleanup:
+        price, unit, qty = cleanup(price_raw, unit, raw_data)
     else:
         price = price_raw
         qty = 1
@@ -551,8 +800,9 @@ def cleanup_mcmaster_data(price, unit):
 
     # Parse price - handle "$10.33 per pack of 10" format
     if "Not Found" not in price:
-        if " per " in price.lower():
-            parts = price.lower().split("per", 1)
+        price_lower = price.lower()
+        if " per " in price_lower:
+            parts = price_lower.split("per", 1)
             price = parts[0].replace('$', '').strip()
 
             # Extract unit and quantity from the "per" part (e.g., "pack of 10")
@@ -560,19 +810,15 @@ def cleanup_mcmaster_data(price, unit):
             if "pack" in per_part and "of" in per_part:
                 unit = "pack"
                 # Extract quantity number
-                qty_parts = per_part.split("of", 1)
-                if len(qty_parts) > 1:
-                    try:
-                        qty = int(''.join(filter(str.isdigit, qty_parts[1])))
-                    except ValueError:
-                        qty = 1
+                qty_digits = NON_DIGIT_RE.sub('', per_part.split("of", 1)[1])
+                qty = int(qty_digits) if qty_digits else 1
             elif "each" in per_part:
                 unit = "each"
                 qty = 1
             # If unit info was in price but couldn't parse, leave unit as-is
 
-        elif "each" in price.lower():
-            parts = price.lower().split("each", 1)
+        elif "each" in price_lower:
+            parts = price_lower.split("each", 1)
             price = parts[0].replace('$', '').strip()
             unit = "each"
             qty = 1
@@ -581,10 +827,11 @@ def cleanup_mcmaster_data(price, unit):
 
     # Only parse unit parameter if it wasn't already extracted from price
     if "Not Found" not in unit and unit not in ["pack", "each"]:
-        if "each" in unit.lower():
+        unit_lower = unit.lower()
+        if "each" in unit_lower:
             unit = "each"
             qty = 1
-        elif "pack" in unit.lower() and "of" in unit.lower():
+        elif "pack" in unit_lower and "of" in unit_lower:
             parts = unit.split(" of ", 1)
             unit = "pack"
             try:
@@ -613,8 +860,7 @@ def cleanup_zoro_data(price, unit):
     
     if "Not Found" not in price:
         # Remove newlines and extra text
-        price = price.replace('\r\n', ' ').replace('\n', ' ')
-        price = price.replace('product price:', '').strip()
+        price = NEWLINE_RE.sub(' ', price).replace('product price:', '').strip()
         
         # Parse format: "$123.45 / pk 10" or "$45.67 / ea"
         parts = price.split(',')
@@ -648,19 +894,21 @@ def cleanup_zoro_data(price, unit):
     
     return str(price), unit, qty
 
+# Vendor key -> cleanup(price, unit, raw_data) returning (price, unit, qty)
+VENDOR_CLEANUP = {
+    'grainger': lambda price, unit, raw: cleanup_grainger_data(price, unit, raw.get('mfrNumber', 'Not Found')),
+    # For McMaster, don't replace MFR number - leave it empty if not found
+    'mcmaster': lambda price, unit, raw: cleanup_mcmaster_data(price, unit),
+    'mcmaster-carr': lambda price, unit, raw: cleanup_mcmaster_data(price, unit),
+    'festo': lambda price, unit, raw: cleanup_festo_data(price, unit, raw.get('qty')),
+    'zoro': lambda price, unit, raw: cleanup_zoro_data(price, unit),
+}
+
 def calculate_percentage_change(old_price, new_price):
     """Calculate percentage change between prices"""
-    def clean_price(price):
-        if price is None or price == '' or price == 'Not Found':
-            return None
-        if isinstance(price, (int, float)):
-            return float(price)
-        cleaned = ''.join(c for c in str(price) if c.isdigit() or c == '.')
-        return float(cleaned) if cleaned else None
-    
     try:
-        old = clean_price(old_price)
-        new = clean_price(new_price)
+        old = format_price_value(old_price)
+        new = format_price_value(new_price)
         
         if old is None or new is None:
             return None
@@ -670,173 +918,601 @@ def calculate_percentage_change(old_price, new_price):
         
         return round(((new - old) / old) * 100, 2)
     except Exception as e:
-        logger.error(f"Error calculating percentage change: {e}")
+        logger.error("Error calculating percentage change: %s", e)
         return None
 
 def update_price_history(entry_data, current_data):
     """Update price history in CSV format"""
-    if current_data[14] is None:
-        current_data[14] = ""
+    if current_data[COL_PRICE_HISTORY] is None:
+        current_data[COL_PRICE_HISTORY] = ""
 
-    if current_data[14] != "":
-        entry_data[14] = current_data[14] + f", Date: {current_data[10]} Price: {current_data[9]}"
-    else:
-        entry_data[14] = f"Date: {current_data[10]} Price: {current_data[9]}"
+    # Existing history (if any) plus the price being replaced, joined once
+    entries = [current_data[COL_PRICE_HISTORY]] if current_data[COL_PRICE_HISTORY] != "" else []
+    entries.append(f"Date: {current_data[COL_DATE]} Price: {current_data[COL_UNIT_PRICE]}")
+    entry_data[COL_PRICE_HISTORY] = ", ".join(entries)
 
-    entry_data[12] = current_data[9]  # Last updated price
-    entry_data[13] = current_data[10]  # Last updated date
+    entry_data[COL_LAST_PRICE] = current_data[COL_UNIT_PRICE]  # Last updated price
+    entry_data[COL_LAST_DATE] = current_data[COL_DATE]  # Last updated date
 
     return entry_data
 
 #
 # EXCEL OPERATIONS
 #
+# The workbook is parsed once per session instead of on every search/save.
+# 'rows' holds the first 15 values of each "Purchase Parts" row (read-only pass),
+# 'index' maps each ACI# to its first row number, 'workbook' is the writable
+# (keep_vba) workbook reused by every save.
+# Edits are written to the workbook in memory and only saved to disk every
+# EXCEL_SAVE_EVERY edits, after a batch, and on exit; 'pending' lists them.
+# 'mtime' is the file's modification time when it was loaded or last saved;
+# if the file changes underneath us the cache is reloaded and pending edits
+# are re-applied on top.
+# Edits that never reach EXCEL_SAVE_EVERY are still saved EXCEL_FLUSH_SECONDS
+# after the first one, so a crash loses at most that much work.
+EXCEL_SAVE_EVERY = 10
+EXCEL_FLUSH_SECONDS = 30
+_FLUSH_TIMER = None
+_FLUSH_FAILED_EDITS = 0  # Pending edits when the last background save failed; 0 after a good save
+_SAVE_FAILURES = queue.Queue()  # Unsaved edit counts from failed background saves, shown by the GUI thread
+SAVE_FAILURE_POLL_MS = 1000  # How often open dialogs check _SAVE_FAILURES
+_EXCEL_LOCK = threading.RLock()
+_EXCEL_CACHE = {'path': None, 'rows': None, 'index': None, 'workbook': None, 'pending': [], 'mtime': None}
+
+def _excel_cache_for(file_path):
+    """Return the Excel cache, resetting it when a different file is used"""
+    if _EXCEL_CACHE['path'] != file_path:
+        # Retry once before the old file's unsaved edits are dropped
+        if not flush_excel() and not flush_excel():
+            logger.error("Discarding %s unsaved edits to %s", len(_EXCEL_CACHE['pending']), _EXCEL_CACHE['path'])
+        _EXCEL_CACHE.update(path=file_path, rows=None, index=None, workbook=None, pending=[], mtime=None)
+    return _EXCEL_CACHE
+
+def _file_mtime(file_path):
+    """Return the file's modification time, or None if it can't be read"""
+    try:
+        return os.stat(file_path).st_mtime
+    except OSError:
+        return None
+
+def _reload_if_changed(file_path):
+    """Drop cached data if the file was modified outside this app, keeping unsaved edits"""
+    with _EXCEL_LOCK:
+        cache = _excel_cache_for(file_path)
+        mtime = _file_mtime(file_path)
+        if cache['mtime'] is None or mtime is None or mtime == cache['mtime']:
+            return
+
+        logger.info("%s changed on disk, reloading", file_path)
+        edits = cache['pending']
+        cache.update(rows=None, index=None, workbook=None, pending=[], mtime=None)
+        if edits:
+            logger.warning("Re-applying %s unsaved edits to the updated file", len(edits))
+            cache['pending'] = _replay_edits(file_path, edits)
+
+def flush_excel():
+    """Save pending edits in the cached workbook to disk; False if the save failed"""
+    global _FLUSH_FAILED_EDITS
+    with _EXCEL_LOCK:
+        cache = _EXCEL_CACHE
+        if not cache['pending']:
+            return True
+        try:
+            _reload_if_changed(cache['path'])
+            _save_workbook(cache['workbook'], cache['path'])
+        except Exception as e:
+            # Keep the edits in memory so the next flush can retry
+            logger.error("Error saving Excel: %s", e)
+            return False
+        logger.info("Excel file saved successfully (%s pending edits written)", len(cache['pending']))
+        cache['pending'] = []
+        cache['mtime'] = _file_mtime(cache['path'])
+        _FLUSH_FAILED_EDITS = 0
+        return True
+
+def _save_workbook(workbook, file_path):
+    """Save to a temp file next to the workbook and swap it in, so a failed save can't truncate it"""
+    tmp_path = file_path + '.tmp'
+    try:
+        workbook.save(filename=tmp_path)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _schedule_flush():
+    """Start the timed save if one isn't already waiting"""
+    global _FLUSH_TIMER
+    if _FLUSH_TIMER is not None and _FLUSH_TIMER.is_alive():
+        return
+    _FLUSH_TIMER = threading.Timer(EXCEL_FLUSH_SECONDS, submit_excel_job, args=(_background_flush,))
+    _FLUSH_TIMER.daemon = True
+    _FLUSH_TIMER.start()
+
+def _record_edit(file_path, edit):
+    """Remember an unsaved edit, saving the workbook once enough have piled up"""
+    with _EXCEL_LOCK:
+        cache = _excel_cache_for(file_path)
+        cache['pending'].append(edit)
+        if len(cache['pending']) >= EXCEL_SAVE_EVERY:
+            # Save in the background so the form that made the edit can close
+            submit_excel_job(_background_flush)
+        else:
+            _schedule_flush()
+
+def _background_flush():
+    """Save on the Excel worker; on failure queue it for the GUI thread and retry later"""
+    global _FLUSH_TIMER, _FLUSH_FAILED_EDITS
+    if flush_excel():
+        return
+    with _EXCEL_LOCK:
+        count = len(_EXCEL_CACHE['pending'])
+        first_failure = not _FLUSH_FAILED_EDITS
+        _FLUSH_FAILED_EDITS = count
+        # Retry in EXCEL_FLUSH_SECONDS; the timer that ran this job may not have exited yet
+        _FLUSH_TIMER = None
+        _schedule_flush()
+    # Tk may only be used from the GUI thread, so just record the failure here
+    if first_failure:
+        _SAVE_FAILURES.put(count)
+
+def report_save_failures():
+    """Show failed background saves queued by the Excel worker; call from the GUI thread only"""
+    count = None
+    while True:
+        try:
+            count = _SAVE_FAILURES.get_nowait()
+        except queue.Empty:
+            break
+    # A later save may already have written the edits
+    if count is None or not _FLUSH_FAILED_EDITS:
+        return False
+    messagebox.showerror("Save Failed",
+                         f"{count} edit(s) could not be saved to Excel and are only held in memory.\n\n"
+                         "Close the workbook in Excel if it is open; the save will be retried.")
+    return True
+
+def watch_save_failures(root):
+    """Poll _SAVE_FAILURES from root's event loop, so a failed save shows while a form is open"""
+    report_save_failures()
+    root.after(SAVE_FAILURE_POLL_MS, watch_save_failures, root)
+
+def _flush_at_exit():
+    """Last save on exit, warning that unsaved edits will be lost if it fails"""
+    if flush_excel():
+        return
+    count = len(_EXCEL_CACHE['pending'])
+    logger.error("%s edits could not be saved to %s and will be lost", count, _EXCEL_CACHE['path'])
+    try:
+        messagebox.showerror("Unsaved Edits",
+                             f"{count} edit(s) could not be saved to Excel and will be lost:\n\n{_EXCEL_CACHE['path']}")
+    except tk.TclError:
+        pass
+
+atexit.register(_flush_at_exit)
+
+# Slow Excel work (the initial parse, periodic saves) runs on one background
+# thread so dialogs are not held up by disk or network share I/O. Jobs still
+# take _EXCEL_LOCK, so searches and saves simply wait for them to finish.
+_EXCEL_JOBS = queue.Queue()
+_EXCEL_WORKER = None
+_EXCEL_WORKER_LOCK = threading.Lock()
+
+def _excel_worker():
+    """Run queued Excel jobs one at a time"""
+    while True:
+        func, args = _EXCEL_JOBS.get()
+        try:
+            func(*args)
+        except Exception as e:
+            logger.error("Background Excel job %s failed: %s", func.__name__, e)
+
+def submit_excel_job(func, *args):
+    """Queue an Excel job for the background worker, starting it on first use"""
+    global _EXCEL_WORKER
+    with _EXCEL_WORKER_LOCK:
+        if _EXCEL_WORKER is None:
+            _EXCEL_WORKER = threading.Thread(target=_excel_worker, name="excel-worker", daemon=True)
+            _EXCEL_WORKER.start()
+    _EXCEL_JOBS.put((func, args))
+
+def _aci_key(value):
+    """Normalize an ACI# cell value for lookups (None for empty cells)"""
+    if value is None:
+        return None
+    # Text is cleaned and stripped in one pass; numbers only need str()
+    if value.__class__ is str:
+        return value.translate(SANITIZE_TABLE).strip()
+    return str(value).strip()
+
+def get_aci_index(file_path):
+    """Return the cached ACI# -> row number index, building it on first use"""
+    with _EXCEL_LOCK:
+        cache = _excel_cache_for(file_path)
+        if cache['index'] is None:
+            index = {}
+            # Local binds: this loop runs once per sheet row
+            aci_key = _aci_key
+            add = index.setdefault
+            for row_index, row in enumerate(get_sheet_rows(file_path), start=1):
+                key = aci_key(row[0])
+                if key is not None:
+                    # Keep the first occurrence, like the original top-down scan
+                    add(key, row_index)
+            cache['index'] = index
+        return cache['index']
+
+# Parsed rows are also kept in a local sidecar file keyed by the workbook's
+# path, mtime and size, so a restart against an unchanged file skips the parse.
+# The sidecar is unpickled, so it must live in a directory only this user can
+# write; without LOCALAPPDATA that is a per-user folder in the temp dir.
+ROWS_CACHE_DIR = (os.path.join(os.environ['LOCALAPPDATA'], 'AdvantageScraper') if os.environ.get('LOCALAPPDATA')
+                  else os.path.join(tempfile.gettempdir(), f"AdvantageScraper-{getpass.getuser()}"))
+
+def _make_cache_dir():
+    """Create ROWS_CACHE_DIR (mode 0700), raising OSError if another user could write to it"""
+    os.makedirs(ROWS_CACHE_DIR, mode=0o700, exist_ok=True)
+    if hasattr(os, 'getuid'):
+        st = os.lstat(ROWS_CACHE_DIR)
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o022:
+            raise PermissionError(f"{ROWS_CACHE_DIR} is not a private directory owned by this user")
+
+def _rows_cache_file(file_path):
+    """Return the sidecar cache path for a workbook"""
+    digest = hashlib.md5(os.path.abspath(file_path).encode('utf-8')).hexdigest()
+    return os.path.join(ROWS_CACHE_DIR, f"rows-{digest}.pickle")
+
+def _file_signature(file_path):
+    """Return (mtime, size) identifying the workbook's current contents, or None"""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return (st.st_mtime, st.st_size)
+
+def _load_cached_rows(file_path, signature):
+    """Return rows from the sidecar cache if it matches the workbook, else None"""
+    try:
+        _make_cache_dir()
+        with open(_rows_cache_file(file_path), 'rb') as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if cached.get('path') != os.path.abspath(file_path) or cached.get('signature') != signature:
+        return None
+    return cached['rows']
+
+def _store_cached_rows(file_path, signature, rows):
+    """Write parsed rows to the sidecar cache (best effort)"""
+    try:
+        _make_cache_dir()
+        tmp_path = _rows_cache_file(file_path) + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'path': os.path.abspath(file_path), 'signature': signature, 'rows': rows},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, _rows_cache_file(file_path))
+    except Exception as e:
+        logger.warning("Could not write row cache: %s", e)
+
+# Vendor pages scraped during batch runs are kept in a local SQLite cache for
+# SCRAPE_CACHE_TTL, so repeating a run over the same ACIs skips the browser.
+# The raw payload is stored, so cached items still go through parsing and the
+# batch match/price checks.
+SCRAPE_CACHE_FILE = os.path.join(ROWS_CACHE_DIR, 'scrapes.sqlite3')
+SCRAPE_CACHE_TTL = 24 * 60 * 60  # Seconds a cached scrape stays fresh
+SCRAPE_CACHE_QUERY_SIZE = 500  # Part #s per lookup query, under SQLite's bound-parameter limit
+SCRAPE_CACHE_ENABLED = True  # Turned off by --no-cache
+_SCRAPE_CACHE_LOCK = threading.Lock()
+
+def _scrape_cache_key(vendor_name, part_number):
+    """Return the (vendor, part #) cache key for a scrape"""
+    return str(vendor_name).strip().lower(), str(part_number).strip()
+
+def _open_scrape_cache():
+    """Open the scrape cache database, creating it on first use"""
+    _make_cache_dir()
+    conn = sqlite3.connect(SCRAPE_CACHE_FILE, timeout=5)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS scrapes ("
+        "vendor TEXT, part TEXT, data TEXT, ts INTEGER, PRIMARY KEY (vendor, part))"
+    )
+    # Lookups use the (vendor, part) primary key; this one serves the expiry sweep
+    conn.execute("CREATE INDEX IF NOT EXISTS scrapes_ts ON scrapes (ts)")
+    return conn
+
+def get_cached_scrapes(parts):
+    """Return fresh cached (payload, scrape time) for (vendor, part #) pairs, keyed by _scrape_cache_key"""
+    if not SCRAPE_CACHE_ENABLED or not parts:
+        return {}
+    by_vendor = {}
+    for vendor_name, part_number in parts:
+        vendor, part = _scrape_cache_key(vendor_name, part_number)
+        by_vendor.setdefault(vendor, set()).add(part)
+    cutoff = int(time.time() - SCRAPE_CACHE_TTL)
+    rows = []
+    try:
+        # Only the batch's keys are read, one primary-key query per vendor and
+        # SCRAPE_CACHE_QUERY_SIZE parts; expired rows are dropped first, so the
+        # table only ever holds the last day's scrapes
+        with _SCRAPE_CACHE_LOCK, closing(_open_scrape_cache()) as conn, conn:
+            conn.execute("DELETE FROM scrapes WHERE ts < ?", (cutoff,))
+            for vendor, vendor_parts in by_vendor.items():
+                vendor_parts = sorted(vendor_parts)
+                for start in range(0, len(vendor_parts), SCRAPE_CACHE_QUERY_SIZE):
+                    chunk = vendor_parts[start:start + SCRAPE_CACHE_QUERY_SIZE]
+                    rows += conn.execute(
+                        "SELECT vendor, part, data, ts FROM scrapes WHERE vendor = ? AND part IN "
+                        f"({','.join('?' * len(chunk))}) AND ts >= ?",
+                        (vendor, *chunk, cutoff)
+                    ).fetchall()
+    except (sqlite3.Error, OSError) as e:
+        logger.warning("Could not read scrape cache: %s", e)
+        return {}
+    return {(vendor, part): (json.loads(data), datetime.fromtimestamp(ts)) for vendor, part, data, ts in rows}
+
+def store_cached_scrape(vendor_name, part_number, raw_data):
+    """Save a scrape payload to the cache (best effort)"""
+    if not SCRAPE_CACHE_ENABLED:
+        return
+    # The tab is closed after the run, so its ID means nothing on a cache hit
+    data = {key: value for key, value in raw_data.items() if key != 'tabId'}
+    try:
+        with _SCRAPE_CACHE_LOCK, closing(_open_scrape_cache()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO scrapes VALUES (?, ?, ?, ?)",
+                (*_scrape_cache_key(vendor_name, part_number), json.dumps(data), int(time.time()))
+            )
+    except (sqlite3.Error, OSError, TypeError, ValueError) as e:
+        logger.warning("Could not write scrape cache: %s", e)
+
+def get_sheet_rows(file_path):
+    """Return cached row values of the Purchase Parts sheet, loading them on first use"""
+    with _EXCEL_LOCK:
+        cache = _excel_cache_for(file_path)
+        if cache['rows'] is None:
+            signature = _file_signature(file_path)
+            if cache['mtime'] is None:
+                cache['mtime'] = signature[0] if signature else None
+
+            rows = _load_cached_rows(file_path, signature) if signature else None
+            if rows is not None:
+                cache['rows'] = rows
+                logger.info("Loaded %s rows for %s from row cache", len(rows), file_path)
+                return rows
+            # Read-only streaming mode. Not data_only, so formula cells come back
+            # as formulas and survive a later save. External link parts are
+            # never needed for a lookup, so skip parsing them.
+            workbook = load_workbook(file_path, read_only=True, keep_links=False)
+            try:
+                sheet = workbook["Purchase Parts"]
+                cache['rows'] = list(sheet.iter_rows(min_row=1, max_col=15, values_only=True))
+            finally:
+                workbook.close()
+            logger.info("Loaded %s rows from %s", len(cache['rows']), file_path)
+            if signature:
+                _store_cached_rows(file_path, signature, cache['rows'])
+        return cache['rows']
+
+def get_writable_workbook(file_path):
+    """Return the cached writable workbook, loading it on first use"""
+    with _EXCEL_LOCK:
+        cache = _excel_cache_for(file_path)
+        if cache['workbook'] is None:
+            if cache['mtime'] is None:
+                cache['mtime'] = _file_mtime(file_path)
+            cache['workbook'] = load_workbook(file_path, read_only=False, keep_vba=True)
+        return cache['workbook']
+
+def _cache_row_values(file_path, row_index, values):
+    """Mirror a row written to the workbook into the cached row values"""
+    with _EXCEL_LOCK:
+        cache = _excel_cache_for(file_path)
+        rows = cache['rows']
+        if rows is None:
+            return
+        while len(rows) < row_index:
+            rows.append((None,) * 15)
+        old_key = _aci_key(rows[row_index - 1][0])
+        rows[row_index - 1] = tuple(values)
+        if old_key != _aci_key(values[0]):
+            # ACI# moved; rebuild the index on the next lookup
+            cache['index'] = None
+
 def process_excel(file_path, search_string):
-    """Search for ACI number and return row data"""
-    workbook = None
+    """Search for ACI number (already in canon_aci form) and return row data"""
     try:
-        logger.info(f"Searching Excel for ACI#: {search_string}")
-        workbook = load_workbook(file_path, read_only=False, keep_vba=True)
-        sheet = workbook["Purchase Parts"]
-
-        for row in sheet.iter_rows(min_row=1, max_col=15, max_row=sheet.max_row):
-            cell_value = row[0].value
-            # Cast both to string and strip whitespace for comparison
-            if cell_value is not None:
-                # Handle both numeric and text values
-                cell_str = str(sanitize_string(cell_value)).strip()
-                search_str = str(search_string).strip()
-                if cell_str == search_str:
-                    row_index = row[0].row
-                    current_data = []
-
-                    # Read and format each cell value
-                    for idx, cell in enumerate(row[:15]):
-                        value = cell.value
-
-                        # Format dates (fields 10, 13: Date, Last Updated Date)
-                        if idx in [10, 13]:
-                            value = format_date_value(value)
-                        else:
-                            value = sanitize_string(value)
-
-                        current_data.append(value)
-
-                    logger.info(f"Found match at row {row_index}")
-                    return current_data, row_index
+        logger.info("Searching Excel for ACI#: %s", search_string)
+
+        with _EXCEL_LOCK:
+            _reload_if_changed(file_path)
+            row_index = get_aci_index(file_path).get(search_string)
+            if row_index is not None:
+                row = get_sheet_rows(file_path)[row_index - 1]
+                current_data = []
+
+                # Read and format each cell value
+                for idx, value in enumerate(row):
+                    # Format dates (fields 10, 13: Date, Last Updated Date)
+                    if idx in DATE_COLUMNS:
+                        value = format_date_value(value)
+                    else:
+                        value = sanitize_string(value)
+
+                    current_data.append(value)
+
+                logger.info("Found match at row %s", row_index)
+                return current_data, row_index
 
         logger.info("No match found")
         return "NOT_FOUND", None
     except Exception as e:
-        logger.error(f"Excel error: {e}")
+        logger.error("Excel error: %s", e)
         return None, None
-    finally:
-        if workbook:
-            workbook.close()
 
 def save_to_excel(file_path, row_index, data):
     """Save updated data to Excel with proper formatting"""
-    workbook = None
     try:
-        workbook = load_workbook(file_path, read_only=False, keep_vba=True)
-        sheet = workbook["Purchase Parts"]
-
-        for idx, value in enumerate(data):
-            cell = sheet.cell(row=row_index, column=idx + 1)
-
-            # Format the value based on field type
-            formatted_value = value
+        with _EXCEL_LOCK:
+            _reload_if_changed(file_path)
+            return _save_row(file_path, row_index, data)
+    except Exception as e:
+        logger.error("Error saving Excel: %s", e)
+        return False
 
-            # Ensure ACI # (col 0) is numeric when purely digits
-            if idx == 0:
-                formatted_value = prepare_aci_for_excel(value)
-            # Format prices (fields 9, 12: Unit Price, Last Updated Price)
-            elif idx in [9, 12]:
-                formatted_value = format_price_value(value)
-            # Format dates (fields 10, 13: Date, Last Updated Date)
-            elif idx in [10, 13]:
-                formatted_value = prepare_date_for_excel(value)
-            else:
-                # For all other fields, clean empty strings to None
-                formatted_value = clean_value_for_excel(value)
+def _save_row(file_path, row_index, data):
+    """Write one row into the cached workbook and record it for the next save (caller holds _EXCEL_LOCK)"""
+    rows = get_sheet_rows(file_path)
+    old_key = _aci_key(rows[row_index - 1][0]) if row_index <= len(rows) else None
+    _apply_row(file_path, row_index, data)
+    _record_edit(file_path, ('row', old_key, row_index, data))
+    logger.info("Row %s updated (saved to disk every %s edits and on exit)", row_index, EXCEL_SAVE_EVERY)
+    return True
+
+def _apply_row(file_path, row_index, data):
+    """Format and write one row into the cached workbook"""
+    workbook = get_writable_workbook(file_path)
+    sheet = workbook["Purchase Parts"]
+    written = []
+    cells = [sheet.cell(row=row_index, column=idx + 1) for idx in range(len(data))]
+    original = [(cell.value, cell.number_format) for cell in cells]
 
-            # Write the value
-            cell.value = formatted_value
+    try:
+        _write_row_cells(cells, data, written)
+    except Exception:
+        # Roll the row back so a half-written row is never saved with other edits
+        for cell, (value, number_format) in zip(cells, original):
+            cell.value = value
+            cell.number_format = number_format
+        raise
+
+    _cache_row_values(file_path, row_index, written)
+
+def _write_row_cells(cells, data, written):
+    """Format and write row values into cells, collecting the written values"""
+    for idx, (cell, value) in enumerate(zip(cells, data)):
+        # Format the value based on field type
+        formatted_value = value
+
+        # Ensure ACI # (col 0) is numeric when purely digits
+        if idx == COL_ACI:
+            formatted_value = prepare_aci_for_excel(value)
+        # Format prices (fields 9, 12: Unit Price, Last Updated Price)
+        elif idx in PRICE_COLUMNS:
+            formatted_value = format_price_value(value)
+        # Format dates (fields 10, 13: Date, Last Updated Date)
+        elif idx in DATE_COLUMNS:
+            formatted_value = prepare_date_for_excel(value)
+        else:
+            # For all other fields, clean empty strings to None
+            formatted_value = clean_value_for_excel(value)
 
-            # Apply number format from COLUMN_FORMATS if defined
-            if idx in COLUMN_FORMATS:
-                cell.number_format = COLUMN_FORMATS[idx]
+        # Write the value
+        cell.value = formatted_value
+        written.append(formatted_value)
 
-        workbook.save(filename=file_path)
-        logger.info("Excel file saved successfully")
-        return True
-    except Exception as e:
-        logger.error(f"Error saving Excel: {e}")
-        return False
-    finally:
-        if workbook:
-            workbook.close()
+        # Apply number format from COLUMN_FORMATS if defined
+        if idx in COLUMN_FORMATS:
+            cell.number_format = COLUMN_FORMATS[idx]
 
 def add_new_row_to_excel(file_path, aci_number, vendor, vendor_part_number):
     """Add a new row to Excel with basic information, copying formatting from last row"""
-    workbook = None
     try:
-        workbook = load_workbook(file_path, read_only=False, keep_vba=True)
-        sheet = workbook["Purchase Parts"]
-
-        # Find the last row with data and next empty row
-        last_row = sheet.max_row
-        next_row = last_row + 1
-
-        # Create new entry with ACI#, Vendor, and Vendor Part# (datetime object, not string)
-        new_data = [None] * 15
-        new_data[0] = prepare_aci_for_excel(aci_number)  # ACI # (numeric if digits only)
-        new_data[6] = vendor  # Vendor
-        new_data[7] = vendor_part_number  # Vendor Part #
-        new_data[10] = datetime.now()  # Date as datetime object
-
-        # Copy formatting from last row and write values
-        from copy import copy
-        for idx, value in enumerate(new_data):
-            col_num = idx + 1
-
-            # Get the cell from the last row to copy formatting from
-            source_cell = sheet.cell(row=last_row, column=col_num)
-            target_cell = sheet.cell(row=next_row, column=col_num)
-
-            # Copy cell formatting (font, border, fill, alignment, etc.)
-            if source_cell.has_style:
-                target_cell.font = copy(source_cell.font)
-                target_cell.border = copy(source_cell.border)
-                target_cell.fill = copy(source_cell.fill)
-                target_cell.protection = copy(source_cell.protection)
-                target_cell.alignment = copy(source_cell.alignment)
-                # Copy number format from source, will be overridden below if in COLUMN_FORMATS
-                target_cell.number_format = copy(source_cell.number_format)
-
-            # Set the value
-            target_cell.value = value
-
-            # Override with enforced column formats for critical fields
-            if idx in COLUMN_FORMATS:
-                target_cell.number_format = COLUMN_FORMATS[idx]
-
-        workbook.save(filename=file_path)
-        logger.info(f"New ACI# {aci_number} added at row {next_row} (formatting applied)")
-
-        # Format dates for display (convert datetime objects to strings)
-        display_data = new_data.copy()
-        for idx in [10, 13]:  # Date fields
-            if display_data[idx] is not None:
-                display_data[idx] = format_date_value(display_data[idx])
-
-        return display_data, next_row
-    except Exception as e:
-        logger.error(f"Error adding new row: {e}")
-        return None, None
-    finally:
-        if workbook:
-            workbook.close()
+        with _EXCEL_LOCK:
+            _reload_if_changed(file_path)
+            return _add_new_row(file_path, aci_number, vendor, vendor_part_number)
+    except Exception as e:
+        logger.error("Error adding new row: %s", e)
+        return None, None
+
+def _add_new_row(file_path, aci_number, vendor, vendor_part_number):
+    """Append the new row to the cached workbook and record it for the next save (caller holds _EXCEL_LOCK)"""
+    new_data, next_row = _apply_new_row(file_path, aci_number, vendor, vendor_part_number)
+    _record_edit(file_path, ('new', aci_number, vendor, vendor_part_number))
+    logger.info("New ACI# %s added at row %s (formatting applied)", aci_number, next_row)
+
+    # Format dates for display (convert datetime objects to strings). new_data is
+    # a fresh list and the row cache holds its own tuple, so format it in place.
+    for idx in DATE_COLUMNS:  # Date fields
+        if new_data[idx] is not None:
+            new_data[idx] = format_date_value(new_data[idx])
+
+    return new_data, next_row
+
+def _apply_new_row(file_path, aci_number, vendor, vendor_part_number):
+    """Append a new row to the cached workbook, returning its values and row number"""
+    workbook = get_writable_workbook(file_path)
+    sheet = workbook["Purchase Parts"]
+
+    # Find the last row with data and next empty row
+    last_row = sheet.max_row
+    next_row = last_row + 1
+
+    # Create new entry with ACI#, Vendor, and Vendor Part# (datetime object, not string)
+    new_data = [None] * 15
+    new_data[COL_ACI] = prepare_aci_for_excel(aci_number)  # ACI # (numeric if digits only)
+    new_data[COL_VENDOR] = vendor  # Vendor
+    new_data[COL_VENDOR_PART] = vendor_part_number  # Vendor Part #
+    new_data[COL_DATE] = datetime.now()  # Date as datetime object
+
+    # Copy formatting from last row and write values
+    try:
+        _write_new_row_cells(sheet, last_row, next_row, new_data)
+    except Exception:
+        # Drop the half-written row so it is never saved with other edits
+        sheet.delete_rows(next_row)
+        raise
+
+    _cache_row_values(file_path, next_row, new_data)
+    return new_data, next_row
+
+def _replay_edits(file_path, edits):
+    """Re-apply unsaved edits to a freshly loaded file, returning the ones that still apply"""
+    replayed = []
+    for edit in edits:
+        try:
+            if edit[0] == 'new':
+                _apply_new_row(file_path, *edit[1:])
+            else:
+                _, old_key, row_index, data = edit
+                # Rows may have moved; follow the ACI# the row had when it was edited
+                rows = get_sheet_rows(file_path)
+                if row_index > len(rows) or _aci_key(rows[row_index - 1][0]) != old_key:
+                    row_index = get_aci_index(file_path).get(old_key)
+                if row_index is None:
+                    logger.error("ACI# %s is no longer in the file; its unsaved edit was dropped", old_key)
+                    continue
+                _apply_row(file_path, row_index, data)
+                edit = ('row', old_key, row_index, data)
+            replayed.append(edit)
+        except Exception as e:
+            logger.error("Could not re-apply unsaved edit: %s", e)
+    return replayed
+
+def _write_new_row_cells(sheet, last_row, next_row, new_data):
+    """Write new row values, copying cell formatting from the last row"""
+    for idx, value in enumerate(new_data):
+        col_num = idx + 1
+
+        # Get the cell from the last row to copy formatting from
+        source_cell = sheet.cell(row=last_row, column=col_num)
+        target_cell = sheet.cell(row=next_row, column=col_num)
+
+        # Copy cell formatting (font, border, fill, alignment, number format, etc.).
+        # Styles live in the workbook's shared tables and cells only hold indices
+        # into them, so copying the index array reuses the existing entries.
+        # The number format is overridden below if the column is in COLUMN_FORMATS.
+        if source_cell.has_style:
+            target_cell._style = copy(source_cell._style)
+
+        # Set the value
+        target_cell.value = value
+
+        # Override with enforced column formats for critical fields
+        if idx in COLUMN_FORMATS:
+            target_cell.number_format = COLUMN_FORMATS[idx]
 
 def prompt_add_new_aci(aci_number):
     """Ask user if they want to add a new ACI number"""
@@ -849,28 +1525,9 @@ def prompt_add_new_aci(aci_number):
 
 def get_new_aci_details(aci_number):
     """Get vendor and vendor part number for new ACI"""
-    global _APP_ICON_PHOTO
-    root = tk.Tk()
+    root = tk.Toplevel(get_app_root())
     root.title(f"Add New ACI# - {aci_number}")
 
-    # Set window icon
-    try:
-        if getattr(sys, 'frozen', False):
-            icon_ico = os.path.join(sys._MEIPASS, 'icon.ico')
-            icon_png = os.path.join(sys._MEIPASS, 'icon.png')
-        else:
-            icon_ico = 'icon.ico'
-            icon_png = 'icon.png'
-
-        if os.path.exists(icon_ico):
-            root.iconbitmap(icon_ico)
-        elif os.path.exists(icon_png):
-            if _APP_ICON_PHOTO is None:
-                _APP_ICON_PHOTO = tk.PhotoImage(file=icon_png)
-            root.iconphoto(True, _APP_ICON_PHOTO)
-    except Exception as e:
-        logger.warning(f"Could not set window icon: {e}")
-
     # Instruction label
     tk.Label(root, text=f"Adding New ACI#: {aci_number}", font=("Arial", 11, "bold")).pack(pady=(15, 10), padx=20)
 
@@ -940,7 +1597,8 @@ def get_new_aci_details(aci_number):
     root.focus_force()
     part_entry.focus_set()
 
-    root.mainloop()
+    # Returns once the dialog is destroyed; the shared root keeps running
+    root.wait_window()
 
     return result['vendor'], result['part_number']
 
@@ -949,253 +1607,378 @@ def get_new_aci_details(aci_number):
 #
 # Global variable to cache PhotoImage to prevent memory leaks
 _APP_ICON_PHOTO = None
+# Hidden root every dialog is a Toplevel of, so Tcl/Tk is initialized once
+_APP_ROOT = None
+
+@functools.lru_cache(maxsize=None)
+def _resolve_icon():
+    """Locate the app icon once, returning (path, 'ico'|'png'|None)"""
+    if getattr(sys, 'frozen', False):
+        # Running as compiled exe - try ICO first for better Windows support
+        icon_ico = os.path.join(sys._MEIPASS, 'icon.ico')
+        icon_png = os.path.join(sys._MEIPASS, 'icon.png')
+    else:
+        # Running as script
+        icon_ico = 'icon.ico'
+        icon_png = 'icon.png'
+
+    # Try ICO first (native Windows format), fallback to PNG
+    if os.path.exists(icon_ico):
+        return icon_ico, 'ico'
+    if os.path.exists(icon_png):
+        return icon_png, 'png'
+    return None, None
+
+def get_app_root():
+    """Return the hidden Tk root shared by all dialogs, creating it on first use"""
+    global _APP_ROOT, _APP_ICON_PHOTO
+    if _APP_ROOT is not None:
+        try:
+            if _APP_ROOT.winfo_exists():
+                return _APP_ROOT
+        except tk.TclError:
+            pass
 
-def get_search_string():
-    """Prompt user for ACI number or batch update"""
-    global _APP_ICON_PHOTO
-    root = tk.Tk()
-    root.title("Advantage Conveyor")
+    root = _APP_ROOT = tk.Tk()
+    root.withdraw()
 
-    # Set window icon
+    # Set the window icon once as the default for every dialog
     try:
-        if getattr(sys, 'frozen', False):
-            # Running as compiled exe - try ICO first for better Windows support
-            icon_ico = os.path.join(sys._MEIPASS, 'icon.ico')
-            icon_png = os.path.join(sys._MEIPASS, 'icon.png')
-        else:
-            # Running as script
-            icon_ico = 'icon.ico'
-            icon_png = 'icon.png'
-
-        # Try ICO first (native Windows format), fallback to PNG
-        if os.path.exists(icon_ico):
-            root.iconbitmap(icon_ico)
-        elif os.path.exists(icon_png):
-            if _APP_ICON_PHOTO is None:
-                _APP_ICON_PHOTO = tk.PhotoImage(file=icon_png)
+        icon_path, icon_kind = _resolve_icon()
+        if icon_kind == 'ico':
+            root.iconbitmap(default=icon_path)
+        elif icon_kind == 'png':
+            _APP_ICON_PHOTO = tk.PhotoImage(master=root, file=icon_path)
             root.iconphoto(True, _APP_ICON_PHOTO)
     except Exception as e:
-        logger.warning(f"Could not set window icon: {e}")
-
-    # Status label
-    status_label = tk.Label(root, text="Server Status: Running ✓", font=("Arial", 9), fg="green")
-    status_label.pack(pady=(12, 2), padx=20)
-
-    # Version label
-    version_label = tk.Label(root, text=f"Version: {APP_VERSION}", font=("Arial", 9), fg="gray")
-    version_label.pack(pady=(0, 8), padx=20)
+        logger.warning("Could not set window icon: %s", e)
 
-    # Instruction label
-    instruction_label = tk.Label(root, text="Enter ACI Number:", font=("Arial", 10))
-    instruction_label.pack(pady=(8, 5), padx=20)
+    # Registered here, on the GUI thread; dialogs' wait_window runs the poll
+    root.after(SAVE_FAILURE_POLL_MS, watch_save_failures, root)
+    return root
 
-    # Entry field
-    entry = tk.Entry(root, font=("Arial", 10), width=25)
-    entry.pack(pady=8, padx=20)
+class SearchDialog:
+    """ACI number prompt, built once and shown again for every search"""
 
-    result = {'value': None, 'mode': 'single'}
+    def __init__(self):
+        self.result = {'value': None, 'mode': 'single'}
 
-    def on_submit():
-        result['value'] = entry.get()
-        result['mode'] = 'single'
-        root.destroy()
+        root = self.root = tk.Toplevel(get_app_root())
+        root.withdraw()
+        root.title("Advantage Conveyor")
+        # Written by close(); show() waits on it instead of running a mainloop
+        self.closed = tk.BooleanVar(root)
 
-    def on_batch():
-        result['value'] = 'BATCH_MODE'
-        result['mode'] = 'batch'
-        root.destroy()
+        # Status label
+        status_label = tk.Label(root, text="Server Status: Running ✓", font=("Arial", 9), fg="green")
+        status_label.pack(pady=(12, 2), padx=20)
 
-    def on_cancel():
-        result['value'] = None
-        result['mode'] = 'single'
-        root.destroy()
+        # Version label
+        version_label = tk.Label(root, text=f"Version: {APP_VERSION}", font=("Arial", 9), fg="gray")
+        version_label.pack(pady=(0, 8), padx=20)
 
-    # Bind Enter key to submit and Escape key to cancel
-    entry.bind('<Return>', lambda e: on_submit())
-    entry.bind('<Escape>', lambda e: on_cancel())
+        # Instruction label
+        instruction_label = tk.Label(root, text="Enter ACI Number:", font=("Arial", 10))
+        instruction_label.pack(pady=(8, 5), padx=20)
 
-    # Buttons
-    button_frame = tk.Frame(root)
-    button_frame.pack(pady=8, padx=20)
-
-    cancel_btn = tk.Button(button_frame, text="Cancel", command=on_cancel, font=("Arial", 10), bg="#f44336", fg="white", width=12)
-    cancel_btn.pack(side=tk.LEFT, padx=5)
+        # Entry field
+        entry = self.entry = tk.Entry(root, font=("Arial", 10), width=25)
+        entry.pack(pady=8, padx=20)
 
-    submit_btn = tk.Button(button_frame, text="Submit", command=on_submit, font=("Arial", 10), bg="#4CAF50", fg="white", width=12)
-    submit_btn.pack(side=tk.LEFT, padx=5)
+        # Bind Enter key to submit and Escape key to cancel
+        entry.bind('<Return>', lambda e: self.submit())
+        entry.bind('<Escape>', lambda e: self.cancel())
 
-    # Batch Update button
-    batch_btn = tk.Button(root, text="Batch Update", command=on_batch, font=("Arial", 10), bg="#2196F3", fg="white", width=15)
-    batch_btn.pack(pady=8, padx=20)
+        # Buttons
+        button_frame = tk.Frame(root)
+        button_frame.pack(pady=8, padx=20)
 
-    root.protocol("WM_DELETE_WINDOW", on_cancel)
+        cancel_btn = tk.Button(button_frame, text="Cancel", command=self.cancel, font=("Arial", 10), bg="#f44336", fg="white", width=12)
+        cancel_btn.pack(side=tk.LEFT, padx=5)
 
-    # Center the window after all widgets are added
-    root.update_idletasks()
-    window_width = root.winfo_width()
-    window_height = root.winfo_height()
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    center_x = int((screen_width - window_width) / 2)
-    center_y = int((screen_height - window_height) / 2)
-    root.geometry(f"+{center_x}+{center_y}")
+        submit_btn = tk.Button(button_frame, text="Submit", command=self.submit, font=("Arial", 10), bg="#4CAF50", fg="white", width=12)
+        submit_btn.pack(side=tk.LEFT, padx=5)
 
-    root.lift()
-    root.attributes('-topmost', True)
-    root.after_idle(root.attributes, '-topmost', False)
-    root.focus_force()
-    entry.focus_set()
-    entry.icursor(tk.END)
+        # Batch Update button
+        batch_btn = tk.Button(root, text="Batch Update", command=self.batch, font=("Arial", 10), bg="#2196F3", fg="white", width=15)
+        batch_btn.pack(pady=8, padx=20)
 
-    root.mainloop()
+        root.protocol("WM_DELETE_WINDOW", self.cancel)
 
-    return result
+        # The layout never changes, so work out the centred position once
+        root.update_idletasks()
+        window_width = root.winfo_reqwidth()
+        window_height = root.winfo_reqheight()
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        self.position = (int((screen_width - window_width) / 2),
+                         int((screen_height - window_height) / 2))
 
-def compare_and_highlight(widget, current_value, new_value):
-    """Highlight widget if values differ"""
-    if str(new_value).strip() != str(current_value).strip():
-        widget.config(bg="yellow")
-    else:
-        widget.config(bg="white")
+    def show(self):
+        """Show the prompt with an empty entry and block until the user answers"""
+        self.result = {'value': None, 'mode': 'single'}
+        root = self.root
+        self.entry.delete(0, tk.END)
 
-def switch_checkbox_state(index, checkboxes, text_boxes, current_text_boxes, fields, entry_data, current_data):
-    """Toggle checkbox and update display"""
-    checkbox = checkboxes[index]
-    # Get the state AFTER the checkbox has been toggled (it's already changed by the time this is called)
-    state = checkbox.var.get()
-
-    # Special handling: Do not overwrite Date field text when toggling KEEP.
-    # We always respect whatever is typed into the Date entry (today's default or backdated).
-    if fields[index] == "Date":
-        try:
-            current_val = current_data[index]
-        except Exception:
-            current_val = ""
-        # Maintain highlight based on difference from current file value
-        compare_and_highlight(text_boxes[index], current_val, text_boxes[index].get())
-        return
-
-    if state:  # Checked - use current data
-        if fields[index] == "Description":
-            text_boxes[index].delete("1.0", tk.END)
-            text_boxes[index].insert(tk.END, current_data[index] if current_data[index] is not None else "")
-            text_boxes[index].config(bg="white")
-        else:
-            text_boxes[index].delete(0, tk.END)
-            text_boxes[index].insert(0, str(current_data[index]) if current_data[index] is not None else "")
-            text_boxes[index].config(bg="white")
-    else:  # Unchecked - use entry data
-        if fields[index] == "Description":
-            text_boxes[index].delete("1.0", tk.END)
-            text_boxes[index].insert(tk.END, entry_data[index] if entry_data[index] is not None else "")
-            compare_and_highlight(text_boxes[index], current_data[index], entry_data[index])
-        else:
-            text_boxes[index].delete(0, tk.END)
-            text_boxes[index].insert(0, str(entry_data[index]) if entry_data[index] is not None else "")
-            compare_and_highlight(text_boxes[index], current_data[index], entry_data[index])
+        root.geometry(f"+{self.position[0]}+{self.position[1]}")
+        root.deiconify()
+        root.lift()
+        root.attributes('-topmost', True)
+        root.after_idle(root.attributes, '-topmost', False)
+        root.focus_force()
+        self.entry.focus_set()
 
-def user_form(current_data, entry_data, fields, file_path, row_index, tab_id=None):
-    """Display GUI form for user confirmation"""
-    global _APP_ICON_PHOTO
-    root = tk.Tk()
-    root.title("Update Data - ACI# " + str(current_data[0]))
+        root.wait_variable(self.closed)
+        return self.result
 
-    # Set window icon
-    try:
-        if getattr(sys, 'frozen', False):
-            # Running as compiled exe - try ICO first for better Windows support
-            icon_ico = os.path.join(sys._MEIPASS, 'icon.ico')
-            icon_png = os.path.join(sys._MEIPASS, 'icon.png')
-        else:
-            # Running as script
-            icon_ico = 'icon.ico'
-            icon_png = 'icon.png'
-
-        # Try ICO first (native Windows format), fallback to PNG
-        if os.path.exists(icon_ico):
-            root.iconbitmap(icon_ico)
-        elif os.path.exists(icon_png):
-            if _APP_ICON_PHOTO is None:
-                _APP_ICON_PHOTO = tk.PhotoImage(file=icon_png)
-            root.iconphoto(True, _APP_ICON_PHOTO)
-    except Exception as e:
-        logger.warning(f"Could not set window icon: {e}")
+    def close(self, value, mode):
+        """Record the answer, hide the prompt for reuse and return from show()"""
+        self.result = {'value': value, 'mode': mode}
+        self.root.withdraw()
+        self.closed.set(True)
 
-    def on_closing():
-        root.quit()
-        root.destroy()
+    def submit(self):
+        self.close(self.entry.get(), 'single')
 
-    root.protocol("WM_DELETE_WINDOW", on_closing)
+    def batch(self):
+        self.close('BATCH_MODE', 'batch')
 
-    large_font = tkFont.Font(family="Arial", size=10)
+    def cancel(self):
+        self.close(None, 'single')
 
-    # Headers
-    tk.Label(root, text="Entry Data", font=large_font).grid(row=0, column=1, padx=5, pady=5)
-    tk.Label(root, text="Current Data", font=large_font).grid(row=0, column=2, padx=2, pady=5)
-    tk.Label(root, text="KEEP", font=large_font).grid(row=0, column=3, padx=(2, 10), pady=2, sticky="w")
+_SEARCH_DIALOG = None
 
-    text_boxes = []
-    current_text_boxes = []
-    checkboxes = []
+def get_search_string():
+    """Prompt user for ACI number or batch update"""
+    global _SEARCH_DIALOG
+    if _SEARCH_DIALOG is not None:
+        try:
+            if not _SEARCH_DIALOG.root.winfo_exists():
+                _SEARCH_DIALOG = None
+        except tk.TclError:
+            _SEARCH_DIALOG = None
+    if _SEARCH_DIALOG is None:
+        _SEARCH_DIALOG = SearchDialog()
+    return _SEARCH_DIALOG.show()
 
-    for i, field in enumerate(fields):
-        tk.Label(root, text=field, font=large_font).grid(row=i + 1, column=0, padx=5, pady=5, sticky="e")
+def compare_and_highlight(widget, current_value, new_value):
+    """Highlight widget if values differ"""
+    if new_value.__class__ is not str:
+        new_value = str(new_value)
+    if current_value.__class__ is not str:
+        current_value = str(current_value)
+    if new_value.strip() != current_value.strip():
+        widget.config(bg="yellow")
+    else:
+        widget.config(bg="white")
 
-        is_not_found = (entry_data[i] == "Not Found")
+def switch_checkbox_state(index, checkboxes, text_boxes, current_text_boxes, fields, entry_data, current_data):
+    """Toggle checkbox and update display"""
+    # Get the state AFTER the checkbox has been toggled (it's already changed by the time this is called)
+    state = checkboxes[index].var.get()
+    show_field_value(index, state, text_boxes, fields, entry_data, current_data)
+
+def show_field_value(index, use_current, text_boxes, fields, entry_data, current_data):
+    """Fill one Entry Data box with the current (KEEP) or scraped value and update its highlight"""
+    text_box = text_boxes[index]
+
+    # Special handling: Do not overwrite Date field text when toggling KEEP.
+    # We always respect whatever is typed into the Date entry (today's default or backdated).
+    if fields[index] == "Date":
+        # Maintain highlight based on difference from current file value
+        compare_and_highlight(text_box, current_data[index], text_box.get())
+        return
+
+    value = current_data[index] if use_current else entry_data[index]
+    if fields[index] == "Description":
+        text_box.delete("1.0", tk.END)
+        text_box.insert(tk.END, value if value is not None else "")
+    else:
+        text_box.delete(0, tk.END)
+        text_box.insert(0, str(value) if value is not None else "")
 
-        if field == "Description":
-            # Multi-line text for description
-            text_box = tk.Text(root, font=large_font, height=7, width=40, wrap="word")
-            text_box.grid(row=i + 1, column=1, padx=5, pady=5)
+    if use_current:
+        text_box.config(bg="white")
+    else:
+        compare_and_highlight(text_box, current_data[index], value)
+
+def estimate_form_size(font, fields):
+    """Estimate the update form's pixel size from its grid layout and font metrics"""
+    char_width = font.measure("0")
+    line_height = font.metrics("linespace")
+    box_width = 40 * char_width + 6  # 40-char Entry/Text plus border
+
+    width = (max(font.measure(field) for field in fields) + 10  # Field labels
+             + box_width + 10  # Entry data column
+             + box_width + 100  # Current data column (padx=50)
+             + 36)  # KEEP checkboxes
+    height = line_height + 10  # Header row
+    for field in fields:
+        lines = 7 if field == "Description" else 1
+        height += lines * line_height + 6 + 10
+    height += line_height + 12 + 20  # Button row
+    return width, height
+
+class UpdateForm:
+    """Update confirmation form, built once and refilled for every item"""
+
+    def __init__(self, fields):
+        self.fields = fields
+        self.current_data = None
+        self.entry_data = None
+        self.file_path = None
+        self.row_index = None
+        self.tab_id = None
+        self.check_all_state = {'checked': False}
+
+        root = self.root = tk.Toplevel(get_app_root())
+        root.withdraw()
+        # Written by close(); show() waits on it instead of running a mainloop
+        self.closed = tk.BooleanVar(root)
+
+        large_font = self.font = tkFont.Font(family="Arial", size=10)
+
+        # Headers
+        tk.Label(root, text="Entry Data", font=large_font).grid(row=0, column=1, padx=5, pady=5)
+        tk.Label(root, text="Current Data", font=large_font).grid(row=0, column=2, padx=2, pady=5)
+        tk.Label(root, text="KEEP", font=large_font).grid(row=0, column=3, padx=(2, 10), pady=2, sticky="w")
+
+        self.text_boxes = []
+        self.current_text_boxes = []
+        self.checkboxes = []
+
+        for i, field in enumerate(fields):
+            tk.Label(root, text=field, font=large_font).grid(row=i + 1, column=0, padx=5, pady=5, sticky="e")
+
+            if field == "Description":
+                # Multi-line text for description
+                text_box = tk.Text(root, font=large_font, height=7, width=40, wrap="word")
+                text_box.grid(row=i + 1, column=1, padx=5, pady=5)
+                current_text_box = tk.Text(root, font=large_font, height=7, width=40, wrap="word", state="normal", takefocus=0)
+                current_text_box.grid(row=i + 1, column=2, padx=50, pady=5)
+            else:
+                # Single-line entry
+                text_box = tk.Entry(root, font=large_font, width=40)
+                text_box.grid(row=i + 1, column=1, padx=5, pady=5)
+                current_text_box = tk.Entry(root, font=large_font, state='readonly', width=40, takefocus=0)
+                current_text_box.grid(row=i + 1, column=2, padx=50, pady=5)
+
+            self.text_boxes.append(text_box)
+            self.current_text_boxes.append(current_text_box)
+
+            # Checkbox
+            var = tk.BooleanVar(root)
+            checkbox = tk.Checkbutton(root, text="", variable=var, onvalue=True, offvalue=False, takefocus=0)
+            checkbox.var = var
+            checkbox.config(command=lambda idx=i: switch_checkbox_state(
+                idx, self.checkboxes, self.text_boxes, self.current_text_boxes, self.fields,
+                self.entry_data, self.current_data
+            ))
+            checkbox.grid(row=i + 1, column=3, padx=(2, 10), pady=2, sticky="w")
+            self.checkboxes.append(checkbox)
+
+        # Check All button and action buttons on same row
+        self.check_all_button = tk.Button(
+            root,
+            text="Check All",
+            command=self.toggle_all_checkboxes,
+            font=large_font,
+            takefocus=0,
+            width=10
+        )
+        self.check_all_button.grid(row=len(fields) + 1, column=2, padx=10, pady=10, sticky="e")
+
+        cancel_button = tk.Button(root, text="Cancel", command=self.cancel, font=large_font, bg="#f44336", fg="white", takefocus=0)
+        cancel_button.grid(row=len(fields) + 1, column=1, padx=20, pady=10)
+
+        submit_button = tk.Button(root, text="Submit", command=self.submit, font=large_font, bg="#4CAF50", fg="white", takefocus=0)
+        submit_button.grid(row=len(fields) + 1, column=2, padx=10, pady=10)
+
+        # Bind keyboard shortcuts
+        root.bind('<Control-s>', lambda e: self.submit())
+        root.bind('<Control-S>', lambda e: self.submit())
+        root.bind('<Escape>', lambda e: self.cancel())
+
+        root.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        # Center using the size estimated from font metrics, so Tk lays the form out
+        # once when it is mapped instead of an extra forced pass to measure it
+        window_width, window_height = estimate_form_size(large_font, fields)
+        screen_width = root.winfo_screenwidth()
+        screen_height = root.winfo_screenheight()
+        self.position = (max(0, int((screen_width - window_width) / 2)),
+                         max(0, int((screen_height - window_height) / 2)))
+
+    def show(self, current_data, entry_data, file_path, row_index, tab_id=None):
+        """Fill the form with one item and block until it is submitted or cancelled"""
+        self.current_data = current_data
+        self.entry_data = entry_data
+        self.file_path = file_path
+        self.row_index = row_index
+        self.tab_id = tab_id
+
+        root = self.root
+        root.title("Update Data - ACI# " + str(current_data[COL_ACI]))
+
+        for i, field in enumerate(self.fields):
+            text_box = self.text_boxes[i]
+            current_text_box = self.current_text_boxes[i]
+            self.checkboxes[i].var.set(False)
+
+            is_not_found = (entry_data[i] == "Not Found")
             entry_text = "" if is_not_found or entry_data[i] is None else str(entry_data[i])
-            text_box.insert(tk.END, entry_text)
-
-            current_text_box = tk.Text(root, font=large_font, height=7, width=40, wrap="word", state="normal", takefocus=0)
-            current_text_box.grid(row=i + 1, column=2, padx=50, pady=5)
-            current_text = "" if current_data[i] is None else str(current_data[i])
-            current_text_box.insert(tk.END, current_text)
-
-            if entry_text.strip() != current_text.strip():
-                text_box.config(bg="yellow")
-        else:
-            # Single-line entry
-            text_box = tk.Entry(root, font=large_font, width=40)
-            text_box.grid(row=i + 1, column=1, padx=5, pady=5)
-            entry_text = "" if is_not_found or entry_data[i] is None else str(entry_data[i])
-
-            # Always prefill Date with today's date on the form to encourage updating
-            # while still allowing manual backdating. Keep entry_data aligned with the visible value.
-            if field == "Date":
-                entry_text = datetime.now().strftime("%m/%d/%Y")
-                entry_data[i] = entry_text
-
-            text_box.insert(0, entry_text)
-
-            current_text_box = tk.Entry(root, font=large_font, state='normal', width=40, takefocus=0)
-            current_text_box.grid(row=i + 1, column=2, padx=50, pady=5)
             current_text = "" if current_data[i] is None else str(current_data[i])
-            current_text_box.insert(0, current_text)
-            current_text_box.config(state="readonly")
 
-        if is_not_found:
-            text_box.config(bg="red")
-
-        compare_and_highlight(text_box, entry_data[i], current_data[i])
-
-        text_boxes.append(text_box)
-        current_text_boxes.append(current_text_box)
-
-        # Checkbox
-        var = tk.BooleanVar()
-        checkbox = tk.Checkbutton(root, text="", variable=var, onvalue=True, offvalue=False, takefocus=0)
-        checkbox.var = var
-        checkbox.config(command=lambda idx=i: switch_checkbox_state(
-            idx, checkboxes, text_boxes, current_text_boxes, fields, entry_data, current_data
-        ))
-        checkbox.grid(row=i + 1, column=3, padx=(2, 10), pady=2, sticky="w")
-        checkboxes.append(checkbox)
-
-    def submit():
+            if field == "Description":
+                text_box.delete("1.0", tk.END)
+                text_box.insert(tk.END, entry_text)
+                current_text_box.delete("1.0", tk.END)
+                current_text_box.insert(tk.END, current_text)
+            else:
+                # Always prefill Date with today's date on the form to encourage updating
+                # while still allowing manual backdating. Keep entry_data aligned with the visible value.
+                if field == "Date":
+                    entry_text = datetime.now().strftime("%m/%d/%Y")
+                    entry_data[i] = entry_text
+
+                text_box.delete(0, tk.END)
+                text_box.insert(0, entry_text)
+                current_text_box.config(state="normal")
+                current_text_box.delete(0, tk.END)
+                current_text_box.insert(0, current_text)
+                current_text_box.config(state="readonly")
+
+            # One highlight call per field (the final colour always came from the comparison)
+            compare_and_highlight(text_box, entry_data[i], current_data[i])
+
+        self.check_all_state['checked'] = False
+        self.check_all_button.config(text="Check All")
+
+        root.geometry(f"+{self.position[0]}+{self.position[1]}")
+        root.deiconify()
+        root.grab_set()
+
+        # Make window active and bring to front
+        root.lift()
+        root.attributes('-topmost', True)
+        root.after_idle(root.attributes, '-topmost', False)
+        root.focus_force()
+
+        root.wait_variable(self.closed)
+
+    def close(self):
+        """Hide the form for reuse and return from show()"""
+        self.root.grab_release()
+        self.root.withdraw()
+        self.closed.set(True)
+
+    def submit(self):
+        fields = self.fields
+        checkboxes = self.checkboxes
+        text_boxes = self.text_boxes
+        current_text_boxes = self.current_text_boxes
+        current_data = self.current_data
+        entry_data = self.entry_data
         try:
             # Update entry_data based on checkboxes
             for i, field in enumerate(fields):
@@ -1213,169 +1996,117 @@ def user_form(current_data, entry_data, fields, file_path, row_index, tab_id=Non
                     else:
                         entry_data[i] = text_boxes[i].get()
 
-            # Calculate price change and update date (allow back-dating)
-            percent_change = 0
-            if current_data[9] not in ['Legacy', 'None', None] and entry_data[9] not in ['Legacy', 'None', None]:
-                try:
-                    percent_change = calculate_percentage_change(current_data[9], entry_data[9])
-
-                    # Update entry_data with calculated values
-                    # Preserve user-entered date if provided/valid; otherwise default to today
-                    try:
-                        user_date_raw = text_boxes[10].get() if len(text_boxes) > 10 else entry_data[10]
-                    except Exception:
-                        user_date_raw = entry_data[10]
-
-                    parsed_date = prepare_date_for_excel(user_date_raw)
-                    entry_data[10] = parsed_date if parsed_date is not None else datetime.now()
-                    entry_data[11] = percent_change  # Change %
-
-                    if percent_change and abs(percent_change) >= 1:
-                        update_price_history(entry_data, current_data)
-                except ValueError as e:
-                    logger.error(f"Price conversion error: {e}")
-            else:
-                # Even if we can't calculate percentage change, keep user-entered date if valid
-                try:
-                    user_date_raw = text_boxes[10].get() if len(text_boxes) > 10 else entry_data[10]
-                except Exception:
-                    user_date_raw = entry_data[10]
-                parsed_date = prepare_date_for_excel(user_date_raw)
-                entry_data[10] = parsed_date if parsed_date is not None else datetime.now()
+            # Calculate price change and update date (allow back-dating)
+            percent_change = 0
+            if current_data[COL_UNIT_PRICE] not in PRICE_SENTINELS and entry_data[COL_UNIT_PRICE] not in PRICE_SENTINELS:
+                try:
+                    percent_change = calculate_percentage_change(current_data[COL_UNIT_PRICE], entry_data[COL_UNIT_PRICE])
+
+                    # Update entry_data with calculated values
+                    # Preserve user-entered date if provided/valid; otherwise default to today
+                    try:
+                        user_date_raw = text_boxes[COL_DATE].get() if len(text_boxes) > COL_DATE else entry_data[COL_DATE]
+                    except Exception:
+                        user_date_raw = entry_data[COL_DATE]
+
+                    parsed_date = prepare_date_for_excel(user_date_raw)
+                    entry_data[COL_DATE] = parsed_date if parsed_date is not None else datetime.now()
+                    entry_data[COL_CHANGE] = percent_change  # Change %
+
+                    if percent_change and abs(percent_change) >= 1:
+                        update_price_history(entry_data, current_data)
+                except ValueError as e:
+                    logger.error("Price conversion error: %s", e)
+            else:
+                # Even if we can't calculate percentage change, keep user-entered date if valid
+                try:
+                    user_date_raw = text_boxes[COL_DATE].get() if len(text_boxes) > COL_DATE else entry_data[COL_DATE]
+                except Exception:
+                    user_date_raw = entry_data[COL_DATE]
+                parsed_date = prepare_date_for_excel(user_date_raw)
+                entry_data[COL_DATE] = parsed_date if parsed_date is not None else datetime.now()
 
             # Alert on significant price changes
             if percent_change and abs(percent_change) >= 20:
                 approve = messagebox.askyesno(
                     "Price Change Alert",
-                    f"Price change is significant: {percent_change}%. Proceed?"
+                    f"Price change is significant: {percent_change}%. Proceed?",
+                    parent=self.root
                 )
                 if not approve:
                     return
             elif percent_change and percent_change <= -10:
                 approve = messagebox.askyesno(
                     "Price Change Alert",
-                    f"Price decrease: {percent_change}%. Proceed?"
+                    f"Price decrease: {percent_change}%. Proceed?",
+                    parent=self.root
                 )
                 if not approve:
                     return
 
             # Save to Excel
-            if save_to_excel(file_path, row_index, entry_data):
+            if save_to_excel(self.file_path, self.row_index, entry_data):
                 # Signal extension to close the tab
-                if tab_id:
-                    TABS_TO_CLOSE.add(tab_id)
-                    logger.info(f"Added tab {tab_id} to close queue")
-                root.destroy()
+                if self.tab_id:
+                    request_tab_close(self.tab_id)
+                    logger.info("Added tab %s to close queue", self.tab_id)
+                self.close()
             else:
-                messagebox.showerror("Error", "Failed to save data")
+                messagebox.showerror("Error", "Failed to save data", parent=self.root)
 
         except Exception as e:
-            logger.error(f"Error in submit: {e}")
-            messagebox.showerror("Error", str(e))
+            logger.error("Error in submit: %s", e)
+            messagebox.showerror("Error", str(e), parent=self.root)
 
-    def cancel():
+    def cancel(self):
         # Signal extension to close the tab
-        if tab_id:
-            TABS_TO_CLOSE.add(tab_id)
-            logger.info(f"Added tab {tab_id} to close queue")
-        root.quit()
-        root.destroy()
-
-    # Check All button and action buttons on same row
-    check_all_state = {'checked': False}
-
-    def toggle_all_checkboxes():
-        check_all_state['checked'] = not check_all_state['checked']
-        for checkbox in checkboxes:
-            # Determine field index first
-            idx = checkboxes.index(checkbox)
-            # Do not toggle the KEEP checkbox for Date; it remains independently controlled
-            if fields[idx] != "Date":
-                checkbox.var.set(check_all_state['checked'])
-            # Trigger the visual update by updating the display
-            if check_all_state['checked']:
-                # Use current data
-                if fields[idx] == "Description":
-                    text_boxes[idx].delete("1.0", tk.END)
-                    text_boxes[idx].insert(tk.END, current_data[idx] if current_data[idx] is not None else "")
-                    text_boxes[idx].config(bg="white")
-                elif fields[idx] == "Date":
-                    # Keep the current Date entry (today's default or user input)
-                    # Do not overwrite with current file value
-                    compare_and_highlight(text_boxes[idx], current_data[idx], text_boxes[idx].get())
-                else:
-                    text_boxes[idx].delete(0, tk.END)
-                    text_boxes[idx].insert(0, str(current_data[idx]) if current_data[idx] is not None else "")
-                    text_boxes[idx].config(bg="white")
-            else:
-                # Use entry data
-                if fields[idx] == "Description":
-                    text_boxes[idx].delete("1.0", tk.END)
-                    text_boxes[idx].insert(tk.END, entry_data[idx] if entry_data[idx] is not None else "")
-                    compare_and_highlight(text_boxes[idx], current_data[idx], entry_data[idx])
-                elif fields[idx] == "Date":
-                    # Keep current Date entry (which we set to today's date initially)
-                    compare_and_highlight(text_boxes[idx], current_data[idx], text_boxes[idx].get())
-                else:
-                    text_boxes[idx].delete(0, tk.END)
-                    text_boxes[idx].insert(0, str(entry_data[idx]) if entry_data[idx] is not None else "")
-                    compare_and_highlight(text_boxes[idx], current_data[idx], entry_data[idx])
+        if self.tab_id:
+            request_tab_close(self.tab_id)
+            logger.info("Added tab %s to close queue", self.tab_id)
+        self.close()
+
+    def toggle_all_checkboxes(self):
+        fields = self.fields
+        text_boxes = self.text_boxes
+        current_data = self.current_data
+        entry_data = self.entry_data
+        check_all_state = self.check_all_state
+
+        check_all_state['checked'] = not check_all_state['checked']
+        for idx, checkbox in enumerate(self.checkboxes):
+            # Do not toggle the KEEP checkbox for Date; it remains independently controlled
+            if fields[idx] != "Date":
+                checkbox.var.set(check_all_state['checked'])
+            # Trigger the visual update by updating the display
+            show_field_value(idx, check_all_state['checked'], text_boxes, fields, entry_data, current_data)
 
         # Update button text
         if check_all_state['checked']:
-            check_all_button.config(text="Uncheck All")
+            self.check_all_button.config(text="Uncheck All")
         else:
-            check_all_button.config(text="Check All")
-
-    check_all_button = tk.Button(
-        root,
-        text="Check All",
-        command=toggle_all_checkboxes,
-        font=large_font,
-        takefocus=0,
-        width=10
-    )
-    check_all_button.grid(row=len(fields) + 1, column=2, padx=10, pady=10, sticky="e")
-
-    cancel_button = tk.Button(root, text="Cancel", command=cancel, font=large_font, bg="#f44336", fg="white", takefocus=0)
-    cancel_button.grid(row=len(fields) + 1, column=1, padx=20, pady=10)
+            self.check_all_button.config(text="Check All")
 
-    submit_button = tk.Button(root, text="Submit", command=submit, font=large_font, bg="#4CAF50", fg="white", takefocus=0)
-    submit_button.grid(row=len(fields) + 1, column=2, padx=10, pady=10)
+_UPDATE_FORM = None
 
-    # Bind keyboard shortcuts
-    root.bind('<Control-s>', lambda e: submit())
-    root.bind('<Control-S>', lambda e: submit())
-    root.bind('<Escape>', lambda e: cancel())
-
-    root.protocol("WM_DELETE_WINDOW", cancel)
-    root.transient()
-    root.grab_set()
-
-    # Center the window after all widgets are added
-    root.update_idletasks()
-    window_width = root.winfo_width()
-    window_height = root.winfo_height()
-    screen_width = root.winfo_screenwidth()
-    screen_height = root.winfo_screenheight()
-    center_x = int((screen_width - window_width) / 2)
-    center_y = int((screen_height - window_height) / 2)
-    root.geometry(f"+{center_x}+{center_y}")
-
-    # Make window active and bring to front
-    root.lift()
-    root.attributes('-topmost', True)
-    root.after_idle(root.attributes, '-topmost', False)
-    root.focus_force()
-
-    root.mainloop()
+def user_form(current_data, entry_data, fields, file_path, row_index, tab_id=None):
+    """Display GUI form for user confirmation"""
+    global _UPDATE_FORM
+    if _UPDATE_FORM is not None:
+        try:
+            if not _UPDATE_FORM.root.winfo_exists():
+                _UPDATE_FORM = None
+        except tk.TclError:
+            _UPDATE_FORM = None
+    if _UPDATE_FORM is None or _UPDATE_FORM.fields != fields:
+        _UPDATE_FORM = UpdateForm(fields)
+    _UPDATE_FORM.show(current_data, entry_data, file_path, row_index, tab_id)
 
 #
 # MAIN WORKFLOW
 #
 def process_item(vendor_name, part_number, current_data, entry_data):
     """Orchestrate the scraping workflow"""
-    logger.info(f"Processing {vendor_name} part {part_number}")
+    logger.info("Processing %s part %s", vendor_name, part_number)
 
     # Clear any stale data before opening new browser tab
     clear_stale_data()
@@ -1404,49 +2135,33 @@ def process_item(vendor_name, part_number, current_data, entry_data):
         return None
 
     # Update entry_data
-    entry_data[1] = parsed_data['mfr_number']
-    entry_data[2] = parsed_data['brand']
-    entry_data[3] = parsed_data['description']
-    entry_data[4] = parsed_data['qty']
-    entry_data[5] = parsed_data['unit']
-    entry_data[9] = parsed_data['price']
-    entry_data[10] = datetime.now().strftime("%m/%d/%Y")  # Date as string for display
-    entry_data[11] = calculate_percentage_change(current_data[9], parsed_data['price'])  # Change %
-
-    logger.info(f"Data parsed successfully: Price=${parsed_data['price']}, Qty={parsed_data['qty']}")
+    entry_data[COL_MFR_PART] = parsed_data['mfr_number']
+    entry_data[COL_MFR] = parsed_data['brand']
+    entry_data[COL_DESCRIPTION] = parsed_data['description']
+    entry_data[COL_QTY] = parsed_data['qty']
+    entry_data[COL_PER] = parsed_data['unit']
+    entry_data[COL_UNIT_PRICE] = parsed_data['price']
+    entry_data[COL_DATE] = datetime.now().strftime("%m/%d/%Y")  # Date as string for display
+    entry_data[COL_CHANGE] = calculate_percentage_change(current_data[COL_UNIT_PRICE], parsed_data['price'])  # Change %
+
+    logger.info("Data parsed successfully: Price=$%s, Qty=%s", parsed_data['price'], parsed_data['qty'])
     return tab_id
 
+@functools.lru_cache(maxsize=256)
 def is_vendor_auto(vendor):
     """Check if vendor supports automatic scraping"""
-    return vendor.lower() in ['grainger', 'mcmaster-carr', 'mcmaster', 'zoro', 'festo']
+    # Every vendor with a product URL template is scraped automatically.
+    # A sheet only has a handful of vendor spellings, so the answers are cached.
+    return vendor.lower() in VENDOR_URL_BUILDERS
 
 #
 # BATCH UPDATE FUNCTIONS
 #
 def batch_update_dialog():
     """Dialog to get list of ACI numbers for batch update"""
-    global _APP_ICON_PHOTO
-    root = tk.Tk()
+    root = tk.Toplevel(get_app_root())
     root.title("Batch Update - Enter ACI Numbers")
 
-    # Set window icon
-    try:
-        if getattr(sys, 'frozen', False):
-            icon_ico = os.path.join(sys._MEIPASS, 'icon.ico')
-            icon_png = os.path.join(sys._MEIPASS, 'icon.png')
-        else:
-            icon_ico = 'icon.ico'
-            icon_png = 'icon.png'
-
-        if os.path.exists(icon_ico):
-            root.iconbitmap(icon_ico)
-        elif os.path.exists(icon_png):
-            if _APP_ICON_PHOTO is None:
-                _APP_ICON_PHOTO = tk.PhotoImage(file=icon_png)
-            root.iconphoto(True, _APP_ICON_PHOTO)
-    except Exception as e:
-        logger.warning(f"Could not set window icon: {e}")
-
     # Instructions
     tk.Label(root, text="Batch Update", font=("Arial", 12, "bold")).pack(pady=(15, 5))
     tk.Label(root, text="Enter ACI numbers (one per line or comma-separated):", font=("Arial", 10)).pack(pady=5)
@@ -1464,12 +2179,7 @@ def batch_update_dialog():
             return
 
         # Parse ACI numbers (support both newlines and commas)
-        aci_list = []
-        for line in text.split('\n'):
-            for item in line.split(','):
-                aci = item.strip()
-                if aci:
-                    aci_list.append(aci.upper())
+        aci_list = [aci for aci in map(canon_aci, ACI_LIST_SPLIT_RE.split(text)) if aci]
 
         if not aci_list:
             messagebox.showwarning("Empty List", "No valid ACI numbers found")
@@ -1509,38 +2219,39 @@ def batch_update_dialog():
     root.focus_force()
     text_area.focus_set()
 
-    root.mainloop()
+    # Returns once the dialog is destroyed; the shared root keeps running
+    root.wait_window()
 
     return result['aci_list']
 
+def match_key(value):
+    """Normalize a part # or unit once for case-insensitive batch matching"""
+    return str(value).strip().casefold() if value else ""
+
 def validate_batch_match(current_data, scraped_data, vendor_name):
     """Validate if scraped data matches current data for batch update"""
     vendor_key = vendor_name.lower().strip()
 
     # Check part number match (skip for McMaster as their part numbers may differ from MFR)
-    if vendor_key not in ['mcmaster', 'mcmaster-carr']:
-        current_part = str(current_data[1]).strip() if current_data[1] else ""
-        scraped_part = str(scraped_data.get('mfr_number', '')).strip()
+    if vendor_key not in MCMASTER_VENDORS:
+        current_part = match_key(current_data[COL_MFR_PART])
+        scraped_part = scraped_data.get('mfr_number', '')
 
         # Allow some flexibility in part number matching
-        part_match = current_part.lower() == scraped_part.lower() if current_part and scraped_part != "Not Found" else True
-
-        if current_part and scraped_part != "Not Found" and not part_match:
+        if current_part and scraped_part != "Not Found" and current_part != match_key(scraped_part):
             return False, "Part number mismatch"
 
     # Check unit match
-    current_unit = str(current_data[5]).strip().lower() if current_data[5] else ""
-    scraped_unit = str(scraped_data.get('unit', '')).strip().lower()
-
-    unit_match = current_unit == scraped_unit if current_unit and scraped_unit != "not found" else True
+    current_unit = match_key(current_data[COL_PER])
+    scraped_unit = match_key(scraped_data.get('unit'))
 
-    if current_unit and scraped_unit != "not found" and not unit_match:
+    if current_unit and scraped_unit != "not found" and current_unit != scraped_unit:
         return False, "Unit mismatch"
 
     return True, "Match"
 
 def batch_update_worker(file_path, aci_list):
-    """Process batch update for list of ACI numbers"""
+    """Process batch update for list of ACI numbers (already in canon_aci form)"""
     results = {
         'updated': [],
         'skipped': [],
@@ -1548,157 +2259,311 @@ def batch_update_worker(file_path, aci_list):
         'not_found': []
     }
 
+    # Drop repeated ACIs (common in pasted lists), keeping the first occurrence
+    unique_acis = list(dict.fromkeys(aci_list))
+    if len(unique_acis) < len(aci_list):
+        logger.info("Removed %s duplicate ACI numbers from the batch", len(aci_list) - len(unique_acis))
+    aci_list = unique_acis
+
     total = len(aci_list)
-    logger.info(f"Starting batch update for {total} ACI numbers")
+    logger.info("Starting batch update for %s ACI numbers", total)
 
-    for idx, aci in enumerate(aci_list):
-        logger.info(f"Processing {idx + 1}/{total}: {aci}")
-
-        try:
-            # Look up ACI in Excel
-            current_data, row_index = process_excel(file_path, aci)
+    # Clear stale data once; scrapes below run side by side
+    clear_stale_data()
 
-            if current_data == "NOT_FOUND":
-                results['not_found'].append(aci)
-                logger.info(f"  ACI {aci} not found in Excel")
-                continue
+    # One timestamp for the whole run, stamped on every updated row
+    run_ts = datetime.now()
 
-            if current_data is None:
-                results['errors'].append((aci, "Excel error"))
-                logger.error(f"  Error loading ACI {aci}")
-                continue
+    # Vendor tabs kept open across the run and reused for later parts
+    tabs = BatchTabs()
 
-            # Check if vendor is auto-supported
-            vendor_name = current_data[6]
-            if not is_vendor_auto(vendor_name):
-                results['skipped'].append((aci, f"Manual vendor: {vendor_name}"))
-                logger.info(f"  Skipped {aci} - manual vendor")
-                continue
-
-            # For hyphenated ACI numbers, only skip for McMaster vendors
-            try:
-                vendor_key = str(vendor_name).strip().lower() if vendor_name else ""
-                if '-' in str(aci) and vendor_key in ['mcmaster', 'mcmaster-carr']:
-                    results['skipped'].append((aci, "Hyphenated ACI - McMaster requires manual update"))
-                    logger.info(f"  Skipped {aci} - hyphenated ACI for McMaster")
-                    continue
-            except Exception as e:
-                logger.warning(f"  Warning while evaluating hyphen rule for {aci}: {e}")
-
-            # Scrape data
-            part_number = current_data[7]
-            entry_data = current_data.copy()
+    # Look up every ACI first, grouping the scrape jobs by vendor part #.
+    # Jobs sharing a part # can't be told apart by the extension, so a group
+    # is scraped in turn while different groups are scraped concurrently.
+    groups = {}
+    for idx, aci in enumerate(aci_list):
+        logger.info("Processing %s/%s: %s", idx + 1, total, aci)
 
-            # Clear stale data before each scrape
-            clear_stale_data()
+        try:
+            job = _batch_lookup(file_path, aci, results)
+            if job:
+                groups.setdefault(part_key(job['part_number']), []).append(job)
+        except Exception as e:
+            results['errors'].append((aci, str(e)))
+            logger.error("  Error processing %s: %s", aci, e, exc_info=True)
+
+    # Parts scraped by an earlier run are taken from the cache in one query and
+    # never reach the browser; a fully cached batch starts no scrape threads.
+    cached = get_cached_scrapes([(job['vendor_name'], job['part_number'])
+                                 for group in groups.values() for job in group])
+    ready = []
+    for key, group in list(groups.items()):
+        misses = []
+        for job in group:
+            hit = cached.get(_scrape_cache_key(job['vendor_name'], job['part_number']))
+            if hit is None:
+                misses.append(job)
+            else:
+                logger.info("  Using cached %s page for %s", job['vendor_name'], job['part_number'])
+                raw_data, job['cached_at'] = hit
+                ready.append((job, True, raw_data))
+        if misses:
+            groups[key] = misses
+        else:
+            del groups[key]
 
-            logger.info(f"  Opening {vendor_name} page for {part_number}")
-            if not BrowserController.open_vendor_page(vendor_name, part_number):
-                results['errors'].append((aci, "Failed to open browser"))
-                continue
+    with ThreadPoolExecutor(max_workers=BATCH_SCRAPE_WORKERS) as executor:
+        futures = [executor.submit(_scrape_batch_group, group, tabs) for group in groups.values()]
+        scraped = (item for future in as_completed(futures) for item in future.result())
+        for job, opened, raw_data in itertools.chain(ready, scraped):
+            try:
+                _batch_apply(file_path, job, opened, raw_data, results, run_ts)
+            except Exception as e:
+                results['errors'].append((job['aci'], str(e)))
+                logger.error("  Error processing %s: %s", job['aci'], e, exc_info=True)
 
-            raw_data = BrowserController.wait_for_scraped_data(timeout=15)
+    tabs.close_all()
 
-            if not raw_data:
-                results['errors'].append((aci, "Scraping timeout"))
-                logger.warning(f"  Timeout for {aci}")
-                # Close any registered tabs
-                if REGISTERED_TABS:
-                    most_recent = max(REGISTERED_TABS.items(), key=lambda x: x[1]['timestamp'])
-                    tab_id = most_recent[0]
-                    TABS_TO_CLOSE.add(tab_id)
-                continue
+    # Write the whole batch to disk in one save
+    if not flush_excel():
+        results['errors'].append(("Excel", "Failed to save workbook (will retry on exit)"))
 
-            tab_id = raw_data.get('tabId')
-            parsed_data = parse_vendor_data(raw_data, vendor_name)
+    return results
 
-            if not parsed_data:
-                results['errors'].append((aci, "Failed to parse data"))
-                if tab_id:
-                    TABS_TO_CLOSE.add(tab_id)
-                continue
+def _batch_lookup(file_path, aci, results):
+    """Look up one batch ACI and return its scrape job, or None if it is skipped"""
+    # Look up ACI in Excel
+    current_data, row_index = process_excel(file_path, aci)
 
-            # Validate match
-            is_match, match_reason = validate_batch_match(current_data, parsed_data, vendor_name)
+    if current_data == "NOT_FOUND":
+        results['not_found'].append(aci)
+        logger.info("  ACI %s not found in Excel", aci)
+        return None
 
-            if not is_match:
-                results['skipped'].append((aci, match_reason))
-                logger.info(f"  Skipped {aci} - {match_reason}")
-                if tab_id:
-                    TABS_TO_CLOSE.add(tab_id)
-                continue
+    if current_data is None:
+        results['errors'].append((aci, "Excel error"))
+        logger.error("  Error loading ACI %s", aci)
+        return None
 
-            # Check price change within ±15%
-            old_price = current_data[9]
-            new_price = parsed_data['price']
+    # Check if vendor is auto-supported
+    vendor_name = current_data[COL_VENDOR]
+    if not is_vendor_auto(vendor_name):
+        results['skipped'].append((aci, f"Manual vendor: {vendor_name}"))
+        logger.info("  Skipped %s - manual vendor", aci)
+        return None
 
-            if new_price == "Not Found":
-                results['skipped'].append((aci, "Price not found"))
-                if tab_id:
-                    TABS_TO_CLOSE.add(tab_id)
-                continue
+    # For hyphenated ACI numbers, only skip for McMaster vendors. The vendor
+    # passed is_vendor_auto, so it is a str.
+    if '-' in aci and vendor_name.strip().lower() in MCMASTER_VENDORS:
+        results['skipped'].append((aci, "Hyphenated ACI - McMaster requires manual update"))
+        logger.info("  Skipped %s - hyphenated ACI for McMaster", aci)
+        return None
 
-            percent_change = calculate_percentage_change(old_price, new_price)
+    return {
+        'aci': aci,
+        'current_data': current_data,
+        'row_index': row_index,
+        'vendor_name': vendor_name,
+        'part_number': current_data[COL_VENDOR_PART],
+    }
 
-            if percent_change is None or abs(percent_change) > 15:
-                reason = f"Price change {percent_change}% exceeds ±15%"
-                results['skipped'].append((aci, reason))
-                logger.info(f"  Skipped {aci} - {reason}")
-                if tab_id:
-                    TABS_TO_CLOSE.add(tab_id)
-                continue
+class BatchTabs:
+    """Idle vendor tabs of a batch run, handed to one scrape at a time"""
+
+    def __init__(self):
+        self.idle = {}  # {vendor key: [tab IDs]}
+        self.lock = threading.Lock()
+
+    def acquire(self, vendor_key):
+        """Take an idle tab for the vendor, or None if there isn't one"""
+        with self.lock:
+            idle = self.idle.get(vendor_key)
+            return idle.pop() if idle else None
+
+    def release(self, vendor_key, tab_id):
+        """Return a tab for the next part from the same vendor"""
+        with self.lock:
+            self.idle.setdefault(vendor_key, []).append(tab_id)
+
+    def close_all(self):
+        """Close every idle tab at the end of the run"""
+        with self.lock:
+            tab_ids = [tab_id for idle in self.idle.values() for tab_id in idle]
+            self.idle.clear()
+        for tab_id in tab_ids:
+            request_tab_close(tab_id)
+
+def _scrape_batch_group(jobs, tabs):
+    """Scrape jobs sharing one vendor part # in turn, returning (job, opened, raw_data) tuples"""
+    scraped = []
+    for job in jobs:
+        vendor_key = job['vendor_name'].lower().strip()
+        pending = register_pending_part(job['part_number'])
+        try:
+            # Reuse an open tab for this vendor, else open a new one
+            tab_id = tabs.acquire(vendor_key)
+            if tab_id is None or not BrowserController.navigate_in_existing_tab(
+                    job['vendor_name'], job['part_number'], tab_id):
+                tab_id = None
+                logger.info("  Opening %s page for %s", job['vendor_name'], job['part_number'])
+                if not BrowserController.open_vendor_page(job['vendor_name'], job['part_number']):
+                    scraped.append((job, False, None))
+                    continue
 
-            # Update entry_data
-            entry_data[9] = new_price
-            entry_data[10] = datetime.now()  # Date
-            entry_data[11] = percent_change  # Change %
+            try:
+                raw_data = pending.get(timeout=15)
+            except queue.Empty:
+                raw_data = None
+        finally:
+            unregister_pending_part(job['part_number'])
+
+        if raw_data and not raw_data.get('manualTimeout'):
+            store_cached_scrape(job['vendor_name'], job['part_number'], raw_data)
+
+        if raw_data and raw_data.get('tabId'):
+            tabs.release(vendor_key, raw_data['tabId'])
+        elif tab_id is not None:
+            # The reused tab never reported back; don't hand it out again
+            request_tab_close(tab_id)
+        scraped.append((job, True, raw_data))
+    return scraped
+
+def _batch_apply(file_path, job, opened, raw_data, results, run_ts):
+    """Validate one scraped batch item and save it to Excel"""
+    aci = job['aci']
+    current_data = job['current_data']
+    vendor_name = job['vendor_name']
+
+    if not opened:
+        results['errors'].append((aci, "Failed to open browser"))
+        return
 
-            if percent_change and abs(percent_change) >= 1:
-                update_price_history(entry_data, current_data)
+    if not raw_data:
+        results['errors'].append((aci, "Scraping timeout"))
+        logger.warning("  Timeout for %s", aci)
+        # Close the tab opened for this part, if it registered
+        tab_id = find_tab_for_part(job['part_number'])
+        if tab_id is not None:
+            request_tab_close(tab_id)
+        return
 
-            # Save to Excel
-            if save_to_excel(file_path, row_index, entry_data):
-                results['updated'].append((aci, f"{old_price} → {new_price} ({percent_change:+.1f}%)"))
-                logger.info(f"  Updated {aci}: {old_price} → {new_price} ({percent_change:+.1f}%)")
-            else:
-                results['errors'].append((aci, "Failed to save"))
+    parsed_data = parse_vendor_data(raw_data, vendor_name)
 
-            # Close tab
-            if tab_id:
-                TABS_TO_CLOSE.add(tab_id)
+    if not parsed_data:
+        results['errors'].append((aci, "Failed to parse data"))
+        return
 
-            # Small delay between items
-            time.sleep(0.5)
+    # Validate match
+    is_match, match_reason = validate_batch_match(current_data, parsed_data, vendor_name)
 
-        except Exception as e:
-            results['errors'].append((aci, str(e)))
-            logger.error(f"  Error processing {aci}: {e}", exc_info=True)
+    if not is_match:
+        results['skipped'].append((aci, match_reason))
+        logger.info("  Skipped %s - %s", aci, match_reason)
+        return
 
-    return results
+    # Check price change within ±15%
+    old_price = current_data[COL_UNIT_PRICE]
+    new_price = parsed_data['price']
 
-def show_batch_summary(results):
-    """Display batch update summary"""
-    global _APP_ICON_PHOTO
-    root = tk.Tk()
-    root.title("Batch Update Summary")
+    if new_price == "Not Found":
+        results['skipped'].append((aci, "Price not found"))
+        return
 
-    # Set window icon
-    try:
-        if getattr(sys, 'frozen', False):
-            icon_ico = os.path.join(sys._MEIPASS, 'icon.ico')
-            icon_png = os.path.join(sys._MEIPASS, 'icon.png')
+    percent_change = calculate_percentage_change(old_price, new_price)
+
+    if percent_change is None or abs(percent_change) > 15:
+        reason = f"Price change {percent_change}% exceeds ±15%"
+        results['skipped'].append((aci, reason))
+        logger.info("  Skipped %s - %s", aci, reason)
+        return
+
+    # Update entry_data
+    entry_data = current_data.copy()
+    entry_data[COL_UNIT_PRICE] = new_price
+    # A cached price is dated when it was scraped, not when this run applied it
+    cached_at = job.get('cached_at')
+    entry_data[COL_DATE] = cached_at or run_ts  # Date
+    entry_data[COL_CHANGE] = percent_change  # Change %
+
+    if percent_change and abs(percent_change) >= 1:
+        update_price_history(entry_data, current_data)
+
+    # Save to Excel
+    if save_to_excel(file_path, job['row_index'], entry_data):
+        cached_note = f" (cached {cached_at:%m/%d %H:%M})" if cached_at else ""
+        results['updated'].append((aci, f"{old_price} → {new_price} ({percent_change:+.1f}%){cached_note}"))
+        logger.info("  Updated %s: %s → %s (%+.1f%%)", aci, old_price, new_price, percent_change)
+    else:
+        results['errors'].append((aci, "Failed to save"))
+
+def _batch_summary_lines(results):
+    """Yield the batch summary details one line at a time, a block per non-empty category"""
+    rule = "=" * 80
+    first = True
+    for key, title in (('updated', "UPDATED"), ('skipped', "SKIPPED"), ('errors', "ERRORS"), ('not_found', "NOT FOUND")):
+        if not results[key]:
+            continue
+        if not first:
+            yield ""
+        first = False
+        yield rule
+        yield f"{title}:"
+        yield rule
+        if key == 'not_found':
+            for aci in results[key]:
+                yield f"  {aci}"
         else:
-            icon_ico = 'icon.ico'
-            icon_png = 'icon.png'
-
-        if os.path.exists(icon_ico):
-            root.iconbitmap(icon_ico)
-        elif os.path.exists(icon_png):
-            if _APP_ICON_PHOTO is None:
-                _APP_ICON_PHOTO = tk.PhotoImage(file=icon_png)
-            root.iconphoto(True, _APP_ICON_PHOTO)
-    except Exception as e:
-        logger.warning(f"Could not set window icon: {e}")
+            for aci, info in results[key]:
+                yield f"  {aci}: {info}"
+
+def _spool_batch_summary(lines, max_chars=BATCH_SUMMARY_MAX_CHARS):
+    """Return (text for the summary widget, path of the full summary file or None)
+
+    A huge summary stalls the text widget, so at most max_chars are kept in
+    memory. Once that is exceeded, every line is streamed to a temp file the
+    user can open, and only the end is kept for display.
+    """
+    tail = deque()
+    tail_chars = 0
+    spool = None
+    spool_failed = False
+    for line in lines:
+        tail.append(line)
+        tail_chars += len(line) + 1
+        try:
+            if spool is not None:
+                spool.write(line + "\n")
+            elif tail_chars > max_chars and not spool_failed:
+                spool = tempfile.NamedTemporaryFile('w', encoding='utf-8', prefix='batch-summary-',
+                                                    suffix='.txt', delete=False)
+                spool.writelines(held + "\n" for held in tail)
+        except OSError as e:
+            logger.warning("Could not write batch summary file: %s", e)
+            if spool is not None:
+                spool.close()
+            spool, spool_failed = None, True
+        while tail_chars > max_chars and len(tail) > 1:
+            tail_chars -= len(tail.popleft()) + 1
+
+    full_log = None
+    if spool is not None:
+        spool.close()
+        full_log = spool.name
+    details = "\n".join(tail)
+    if full_log or spool_failed:
+        where = f"; full text in {full_log}" if full_log else ""
+        details = f"(Showing the end of the summary{where})\n\n{details}"
+    return details, full_log
+
+def show_batch_summary(results, autoclose_ms=BATCH_SUMMARY_AUTOCLOSE_MS):
+    """Display batch update summary, closing it after autoclose_ms if given"""
+    if not any(results.values()):
+        # Nothing was looked up, so there is nothing to lay out
+        messagebox.showinfo("Batch Update Complete", "No items were processed.", parent=get_app_root())
+        return
+
+    root = tk.Toplevel(get_app_root())
+    root.title("Batch Update Summary")
 
     # Title
     tk.Label(root, text="Batch Update Complete", font=("Arial", 14, "bold")).pack(pady=(15, 10))
@@ -1716,40 +2581,22 @@ def show_batch_summary(results):
     text_area = scrolledtext.ScrolledText(root, font=("Courier", 9), width=85, height=20)
     text_area.pack(pady=10, padx=20)
 
-    # Build details
-    details = []
-
-    if results['updated']:
-        details.append("=" * 80)
-        details.append("UPDATED:")
-        details.append("=" * 80)
-        for aci, info in results['updated']:
-            details.append(f"  {aci}: {info}")
-
-    if results['skipped']:
-        details.append("\n" + "=" * 80)
-        details.append("SKIPPED:")
-        details.append("=" * 80)
-        for aci, reason in results['skipped']:
-            details.append(f"  {aci}: {reason}")
-
-    if results['errors']:
-        details.append("\n" + "=" * 80)
-        details.append("ERRORS:")
-        details.append("=" * 80)
-        for aci, error in results['errors']:
-            details.append(f"  {aci}: {error}")
-
-    if results['not_found']:
-        details.append("\n" + "=" * 80)
-        details.append("NOT FOUND:")
-        details.append("=" * 80)
-        for aci in results['not_found']:
-            details.append(f"  {aci}")
-
-    text_area.insert("1.0", "\n".join(details))
+    details, full_log = _spool_batch_summary(_batch_summary_lines(results))
+    text_area.insert("1.0", details)
     text_area.config(state="disabled")
 
+    if full_log:
+        def open_full_log():
+            try:
+                if sys.platform == 'win32':
+                    os.startfile(full_log)
+                else:
+                    webbrowser.open('file://' + os.path.abspath(full_log))
+            except Exception as e:
+                logger.warning("Could not open batch summary file: %s", e)
+
+        tk.Button(root, text="Open full log", command=open_full_log, font=("Arial", 10), width=15).pack()
+
     # Close button
     close_btn = tk.Button(root, text="Close", command=root.destroy, font=("Arial", 11), bg="#2196F3", fg="white", width=15)
     close_btn.pack(pady=15)
@@ -1771,17 +2618,30 @@ def show_batch_summary(results):
     root.after_idle(root.attributes, '-topmost', False)
     root.focus_force()
 
-    root.mainloop()
+    close_job = root.after(autoclose_ms, root.destroy) if autoclose_ms else None
+
+    # Returns once the dialog is destroyed; the shared root keeps running
+    root.wait_window()
+    if close_job is not None:
+        root.after_cancel(close_job)
 
 def main_loop(file_path):
     """Main application loop"""
     logger.info("Starting main application loop")
 
     while True:
+        # A background save failed: retry it now and tell the user if it still fails
+        if _FLUSH_FAILED_EDITS and not flush_excel():
+            _SAVE_FAILURES.put(len(_EXCEL_CACHE['pending']))
+        report_save_failures()
+
         result = get_search_string()
 
         if result['value'] is None:
             logger.info("User cancelled, exiting")
+            if not flush_excel():
+                messagebox.showerror("Error", "Failed to save data to Excel.\n\nClose the workbook in Excel and try again.")
+                continue
             break
 
         # Check if batch mode
@@ -1796,7 +2656,7 @@ def main_loop(file_path):
                 continue
 
             # Process batch
-            logger.info(f"Starting batch update for {len(aci_list)} ACIs")
+            logger.info("Starting batch update for %s ACIs", len(aci_list))
             batch_results = batch_update_worker(file_path, aci_list)
 
             # Show summary
@@ -1805,8 +2665,8 @@ def main_loop(file_path):
             continue
 
         # Single mode
-        search_string = sanitize_string(result['value']).upper()
-        logger.info(f"Searching for: {search_string}")
+        search_string = canon_aci(result['value'])
+        logger.info("Searching for: %s", search_string)
 
         try:
             # Search Excel
@@ -1817,7 +2677,7 @@ def main_loop(file_path):
 
             # Handle "NOT_FOUND" case - offer to add new ACI
             if result_data[0] == "NOT_FOUND":
-                logger.info(f"ACI {search_string} not found")
+                logger.info("ACI %s not found", search_string)
 
                 if prompt_add_new_aci(search_string):
                     # Get vendor and part number
@@ -1848,16 +2708,16 @@ def main_loop(file_path):
                     # If auto vendor, try to scrape
                     tab_id = None
                     if is_vendor_auto(vendor):
-                        logger.info(f"Auto-scraping enabled for new entry: {vendor}")
+                        logger.info("Auto-scraping enabled for new entry: %s", vendor)
                         tab_id = process_item(vendor, part_number, current_data, entry_data)
 
                         # Check for registered tabs if scraping timed out
-                        if tab_id is None and REGISTERED_TABS:
-                            most_recent = max(REGISTERED_TABS.items(), key=lambda x: x[1]['timestamp'])
-                            tab_id = most_recent[0]
-                            logger.info(f"Using registered tab {tab_id}")
+                        if tab_id is None:
+                            tab_id = most_recent_tab()
+                            if tab_id is not None:
+                                logger.info("Using registered tab %s", tab_id)
                     else:
-                        logger.info(f"Manual vendor for new entry: {vendor}")
+                        logger.info("Manual vendor for new entry: %s", vendor)
 
                     # Show user form
                     user_form(current_data, entry_data, FIELDS, file_path, row_index, tab_id)
@@ -1871,32 +2731,50 @@ def main_loop(file_path):
 
             # Check if vendor supports auto-scraping
             tab_id = None
-            vendor_name = current_data[6]
+            vendor_name = current_data[COL_VENDOR]
             if is_vendor_auto(vendor_name):
-                part_number = current_data[7]
-                logger.info(f"Auto-scraping enabled for {vendor_name}")
+                part_number = current_data[COL_VENDOR_PART]
+                logger.info("Auto-scraping enabled for %s", vendor_name)
                 tab_id = process_item(vendor_name, part_number, current_data, entry_data)
 
                 # Even if scraping timed out, check if a tab was registered
-                if tab_id is None and REGISTERED_TABS:
+                if tab_id is None:
                     # Get the most recently registered tab (likely the one we just opened)
-                    most_recent = max(REGISTERED_TABS.items(), key=lambda x: x[1]['timestamp'])
-                    tab_id = most_recent[0]
-                    logger.info(f"Using registered tab {tab_id} (scraping may have timed out)")
+                    tab_id = most_recent_tab()
+                    if tab_id is not None:
+                        logger.info("Using registered tab %s (scraping may have timed out)", tab_id)
             else:
-                logger.info(f"Manual vendor: {vendor_name}")
+                logger.info("Manual vendor: %s", vendor_name)
 
             # Show user form (pass tab_id if available)
             user_form(current_data, entry_data, FIELDS, file_path, row_index, tab_id)
 
         except Exception as e:
-            logger.error(f"Error in main loop: {e}", exc_info=True)
+            logger.error("Error in main loop: %s", e, exc_info=True)
             messagebox.showerror("Error", f"An error occurred: {str(e)}")
             continue
 
 #
 # APPLICATION ENTRY POINT
 #
+SERVER_PROBE_TIMEOUT = 10  # Seconds to wait for the Z: share before falling back to a local file
+
+def find_server_workbook(paths, timeout=SERVER_PROBE_TIMEOUT):
+    """Return the first server workbook path that exists, or None if none does or the share hangs"""
+    # A disconnected network drive can block os.path.exists for a long time,
+    # so probe from a daemon thread and stop waiting after the timeout
+    found = []
+    probe = threading.Thread(
+        target=lambda: found.append(next((path for path in paths if os.path.exists(path)), None)),
+        daemon=True
+    )
+    probe.start()
+    probe.join(timeout)
+    if probe.is_alive():
+        logger.warning("Server share did not respond within %ss", timeout)
+        return None
+    return found[0] if found else None
+
 def main():
     """Application entry point"""
     # Parse command-line arguments
@@ -1905,19 +2783,30 @@ def main():
         epilog='If no arguments provided, runs in interactive GUI mode'
     )
     parser.add_argument('-V', '--version', action='version', version=f'%(prog)s {APP_VERSION}')
-    parser.add_argument(
+    # --batch and --batch-file are alternative sources for the same ACI list
+    batch_source = parser.add_mutually_exclusive_group()
+    batch_source.add_argument(
         '--batch',
         type=str,
         help='Batch update mode: comma-separated list of ACI numbers (e.g., "ACI001,ACI002,ACI003")'
     )
-    parser.add_argument(
+    batch_source.add_argument(
         '--batch-file',
         type=str,
         help='Batch update mode: path to file containing ACI numbers (one per line)'
     )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Batch update mode: scrape every vendor page again instead of reusing results from the last 24 hours'
+    )
 
     args = parser.parse_args()
 
+    global SCRAPE_CACHE_ENABLED
+    if args.no_cache:
+        SCRAPE_CACHE_ENABLED = False
+
     try:
         # Determine file path - check multiple extensions
         server_file_paths = [
@@ -1931,18 +2820,16 @@ def main():
         file_path = None
 
         # Check server paths first
-        for path in server_file_paths:
-            if os.path.exists(path):
-                file_path = path
-                logger.info(f"Using server file: {file_path}")
-                break
+        file_path = find_server_workbook(server_file_paths)
+        if file_path:
+            logger.info("Using server file: %s", file_path)
 
         # If no server file found, check local paths
         if not file_path:
             for path in local_file_paths:
                 if os.path.exists(path):
                     file_path = path
-                    logger.info(f"Using local file: {file_path}")
+                    logger.info("Using local file: %s", file_path)
                     # Only show warning in GUI mode
                     if not args.batch and not args.batch_file:
                         messagebox.showwarning("Warning", "Server file not found. Using local file.")
@@ -1963,10 +2850,9 @@ def main():
             logger.error("No Excel file found")
             sys.exit(1)
 
-        # Start Flask server
-        start_flask_server()
-
-        # Check if batch mode requested via command line
+        # Read CLI batch input before starting the server and background
+        # loads, so a bad --batch/--batch-file fails without binding the port
+        aci_list = None
         if args.batch or args.batch_file:
             logger.info("Batch mode activated via command line")
 
@@ -1974,28 +2860,23 @@ def main():
             aci_list = []
             if args.batch:
                 # Parse comma-separated list
-                for item in args.batch.split(','):
-                    aci = item.strip().upper()
-                    if aci:
-                        aci_list.append(aci)
-                logger.info(f"Batch list from --batch: {len(aci_list)} ACIs")
+                aci_list = [aci for aci in map(canon_aci, args.batch.split(',')) if aci]
+                logger.info("Batch list from --batch: %s ACIs", len(aci_list))
 
             elif args.batch_file:
                 # Read from file
                 if not os.path.exists(args.batch_file):
-                    logger.error(f"Batch file not found: {args.batch_file}")
+                    logger.error("Batch file not found: %s", args.batch_file)
                     print(f"ERROR: File not found: {args.batch_file}")
                     sys.exit(1)
 
                 try:
                     with open(args.batch_file, 'r') as f:
-                        for line in f:
-                            aci = line.strip().upper()
-                            if aci and not aci.startswith('#'):  # Allow comments
-                                aci_list.append(aci)
-                    logger.info(f"Batch list from file: {len(aci_list)} ACIs")
+                        # One ACI per line; lines starting with # are comments
+                        aci_list = [aci for aci in map(canon_aci, f) if aci and not aci.startswith('#')]
+                    logger.info("Batch list from file: %s ACIs", len(aci_list))
                 except Exception as e:
-                    logger.error(f"Failed to read batch file: {e}")
+                    logger.error("Failed to read batch file: %s", e)
                     print(f"ERROR: Failed to read file: {e}")
                     sys.exit(1)
 
@@ -2004,8 +2885,26 @@ def main():
                 print("ERROR: No ACI numbers found in batch input")
                 sys.exit(1)
 
+        # Start Flask server
+        start_flask_server()
+
+        # Parse the workbook in the background while the first dialog is shown;
+        # the first search waits for it if the user is quicker. The writable
+        # session workbook is opened right after, so the first save doesn't pay
+        # for the full keep_vba parse either.
+        submit_excel_job(get_sheet_rows, file_path)
+        submit_excel_job(get_writable_workbook, file_path)
+
+        # Locate Chrome now so the first vendor page opens without the lookup
+        try:
+            BrowserController.get_browser()
+        except webbrowser.Error as e:
+            logger.warning("No browser available: %s", e)
+
+        # Check if batch mode requested via command line
+        if aci_list is not None:
             # Run batch update
-            logger.info(f"Starting CLI batch update for {len(aci_list)} ACIs")
+            logger.info("Starting CLI batch update for %s ACIs", len(aci_list))
             print(f"Starting batch update for {len(aci_list)} ACI numbers...")
 
             batch_results = batch_update_worker(file_path, aci_list)
@@ -2053,7 +2952,7 @@ def main():
         logger.info("Program terminated by user")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}", exc_info=True)
+        logger.error("Fatal error: %s", e, exc_info=True)
         messagebox.showerror("Fatal Error", str(e))
         sys.exit(1)
     finally:
@@ -0,0 +1,35 @@
+"""Tests for routing scraped data to pending batch parts in main.py (run with pytest)"""
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def pending():
+    """Register a few batch parts in flight, unregistering them afterwards"""
+    parts = ['1A', '6MN37', 'AB-12']
+    queues = {part: main.register_pending_part(part) for part in parts}
+    while not main.DATA_QUEUE.empty():
+        main.DATA_QUEUE.get_nowait()
+    yield queues
+    for part in parts:
+        main.unregister_pending_part(part)
+
+
+def test_exact_part_number_wins(pending):
+    main.queue_scraped_data({'partNumber': '6mn37', 'url': 'https://www.grainger.com/product/1A/'})
+    assert pending['6MN37'].get_nowait()['partNumber'] == '6mn37'
+    assert pending['1A'].empty()
+
+
+def test_url_path_segment_matches_whole_part_number(pending):
+    main.queue_scraped_data({'partNumber': '', 'url': 'https://www.mcmaster.com/ab-12/'})
+    assert not pending['AB-12'].empty()
+
+
+def test_part_number_inside_another_goes_to_data_queue(pending):
+    # '1A' is a substring of G1A99 but must not claim its page
+    main.queue_scraped_data({'partNumber': 'G1A99', 'url': 'https://www.zoro.com/i/G1A99/'})
+    assert all(q.empty() for q in pending.values())
+    assert main.DATA_QUEUE.get_nowait()['partNumber'] == 'G1A99'
@@ -0,0 +1,103 @@
+"""Tests for the deferred Excel saves in main.py (run with pytest)"""
+
+import os
+import shutil
+import threading
+
+import pytest
+from openpyxl import load_workbook
+
+import main
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+@pytest.fixture
+def workbook(tmp_path, monkeypatch):
+    """A private copy of MML.xlsm with fresh Excel and row caches"""
+    path = str(tmp_path / 'MML.xlsm')
+    shutil.copy(os.path.join(HERE, 'MML.xlsm'), path)
+    monkeypatch.setattr(main, 'ROWS_CACHE_DIR', str(tmp_path / 'cache'))
+    main._EXCEL_CACHE.update(path=None, rows=None, index=None, workbook=None, pending=[], mtime=None)
+    main._FLUSH_FAILED_EDITS = 0
+    while not main._SAVE_FAILURES.empty():
+        main._SAVE_FAILURES.get_nowait()
+    yield path
+    if main._FLUSH_TIMER is not None:
+        main._FLUSH_TIMER.cancel()
+    main._EXCEL_CACHE.update(path=None, rows=None, index=None, workbook=None, pending=[], mtime=None)
+    main._FLUSH_FAILED_EDITS = 0
+
+
+def edit_price(path, aci, price):
+    """Change one row's unit price in memory, leaving the save pending"""
+    current_data, row_index = main.process_excel(path, aci)
+    entry_data = list(current_data)
+    entry_data[main.COL_UNIT_PRICE] = price
+    assert main.save_to_excel(path, row_index, entry_data)
+
+
+def run_on_excel_worker(func):
+    """Run func on the Excel worker thread and wait for it to finish"""
+    done = threading.Event()
+    main.submit_excel_job(func)
+    main.submit_excel_job(done.set)
+    assert done.wait(30)
+
+
+def test_failed_background_save_is_reported_on_gui_thread(workbook, monkeypatch):
+    edit_price(workbook, '6MN37', '25.00')
+
+    def locked(*args):
+        raise PermissionError("workbook is open in Excel")
+    monkeypatch.setattr(main, '_save_workbook', locked)
+    run_on_excel_worker(main._background_flush)
+    assert main._FLUSH_FAILED_EDITS == 1
+    assert len(main._EXCEL_CACHE['pending']) == 1
+
+    shown = []
+    monkeypatch.setattr(main.messagebox, 'showerror',
+                        lambda title, message: shown.append((title, threading.current_thread())))
+    assert main.report_save_failures()
+    assert shown == [("Save Failed", threading.main_thread())]
+    # Reported once, not again on the next check
+    assert not main.report_save_failures()
+
+
+def test_open_dialogs_poll_for_failed_saves(workbook, monkeypatch):
+    class Root:
+        def __init__(self):
+            self.scheduled = []
+
+        def after(self, ms, func, *args):
+            self.scheduled.append((ms, func, args))
+
+    main._FLUSH_FAILED_EDITS = 3
+    main._SAVE_FAILURES.put(3)
+    shown = []
+    monkeypatch.setattr(main.messagebox, 'showerror', lambda title, message: shown.append(message))
+    root = Root()
+    main.watch_save_failures(root)
+    assert len(shown) == 1 and shown[0].startswith("3 edit(s)")
+    # The poll keeps itself scheduled on the same root
+    assert root.scheduled == [(main.SAVE_FAILURE_POLL_MS, main.watch_save_failures, (root,))]
+
+
+def test_flush_replays_edits_after_external_change(workbook):
+    edit_price(workbook, '6MN37', '25.00')
+    _, edited_row = main.process_excel(workbook, '6MN37')
+    _, other_row = main.process_excel(workbook, '2F971')
+
+    # Someone else saves the workbook while our edit is still pending
+    external = load_workbook(workbook, keep_vba=True)
+    external["Purchase Parts"].cell(row=other_row, column=main.COL_DESCRIPTION + 1, value="Changed in Excel")
+    external.save(workbook)
+    mtime = os.stat(workbook).st_mtime + 10
+    os.utime(workbook, (mtime, mtime))
+
+    assert main.flush_excel()
+    assert main._EXCEL_CACHE['pending'] == []
+
+    sheet = load_workbook(workbook, read_only=True)["Purchase Parts"]
+    assert sheet.cell(row=other_row, column=main.COL_DESCRIPTION + 1).value == "Changed in Excel"
+    assert float(sheet.cell(row=edited_row, column=main.COL_UNIT_PRICE + 1).value) == 25.0
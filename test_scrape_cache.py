@@ -0,0 +1,73 @@
+"""Tests for the SQLite scrape cache in main.py (run with pytest)"""
+
+import sqlite3
+import time
+
+import pytest
+
+import main
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    """Point the scrape cache at an empty private directory"""
+    monkeypatch.setattr(main, 'ROWS_CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(main, 'SCRAPE_CACHE_FILE', str(tmp_path / 'cache' / 'scrapes.sqlite3'))
+    monkeypatch.setattr(main, 'SCRAPE_CACHE_ENABLED', True)
+    return main.SCRAPE_CACHE_FILE
+
+
+def age_entry(cache_file, part, seconds):
+    """Make a cached scrape look older than it is"""
+    with sqlite3.connect(cache_file) as conn:
+        conn.execute("UPDATE scrapes SET ts = ts - ? WHERE part = ?", (seconds, part))
+
+
+def test_only_requested_keys_are_returned(cache):
+    main.store_cached_scrape('Grainger', '6MN37', {'price': '$1.00', 'tabId': 7})
+    main.store_cached_scrape('Zoro', 'G123', {'price': '$2.00'})
+    main.store_cached_scrape('Grainger', 'OTHER', {'price': '$3.00'})
+
+    hits = main.get_cached_scrapes([(' grainger ', '6MN37'), ('Zoro', 'G123'), ('Grainger', 'MISSING')])
+
+    assert set(hits) == {('grainger', '6MN37'), ('zoro', 'G123')}
+    data, cached_at = hits[('grainger', '6MN37')]
+    # The tab ID means nothing once the run is over
+    assert data == {'price': '$1.00'}
+    assert abs(time.time() - cached_at.timestamp()) < 60
+
+
+def test_keys_are_looked_up_in_chunks(cache, monkeypatch):
+    monkeypatch.setattr(main, 'SCRAPE_CACHE_QUERY_SIZE', 2)
+    parts = [f"P{i}" for i in range(5)]
+    for part in parts:
+        main.store_cached_scrape('Grainger', part, {'price': part})
+
+    hits = main.get_cached_scrapes([('Grainger', part) for part in parts])
+
+    assert {key[1]: data['price'] for key, (data, _) in hits.items()} == {part: part for part in parts}
+
+
+def test_expired_entries_are_ignored_and_dropped(cache):
+    main.store_cached_scrape('Grainger', 'FRESH', {'price': '$1.00'})
+    main.store_cached_scrape('Grainger', 'STALE', {'price': '$2.00'})
+    age_entry(cache, 'FRESH', main.SCRAPE_CACHE_TTL - 60)
+    age_entry(cache, 'STALE', main.SCRAPE_CACHE_TTL + 60)
+
+    hits = main.get_cached_scrapes([('Grainger', 'FRESH'), ('Grainger', 'STALE')])
+
+    assert set(hits) == {('grainger', 'FRESH')}
+    # The scrape time is the stored one, not the time of the lookup
+    assert time.time() - hits[('grainger', 'FRESH')][1].timestamp() > main.SCRAPE_CACHE_TTL - 120
+    with sqlite3.connect(cache) as conn:
+        assert [row[0] for row in conn.execute("SELECT part FROM scrapes")] == ['FRESH']
+
+
+def test_disabled_cache_is_not_read_or_written(cache, monkeypatch):
+    main.store_cached_scrape('Grainger', '6MN37', {'price': '$1.00'})
+    monkeypatch.setattr(main, 'SCRAPE_CACHE_ENABLED', False)
+    main.store_cached_scrape('Grainger', '2F971', {'price': '$2.00'})
+
+    assert main.get_cached_scrapes([('Grainger', '6MN37')]) == {}
+    monkeypatch.setattr(main, 'SCRAPE_CACHE_ENABLED', True)
+    assert set(main.get_cached_scrapes([('Grainger', '6MN37'), ('Grainger', '2F971')])) == {('grainger', '6MN37')}